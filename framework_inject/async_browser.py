@@ -0,0 +1,104 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+from playwright.async_api import async_playwright
+
+from framework_inject.browser import DriverWebSocket, browser, localization, browser_profile, get_launch_options, \
+    get_viewport
+from framework_inject.constants import PLAYWRIGHT_PAGE_DEFAULT_TIMEOUT_MS, BROWSERS, \
+    CHROME_BROWSER, FIREFOX_BROWSER, REMOTE_CHROME_BROWSER, REMOTE_FIREFOX_BROWSER, PLAYWRIGHT_DEFAULT_LOCALE
+from framework_inject.logger.logger import Logger
+from framework_inject.network import get_route_layer
+
+
+async def new_async_page_context(browser, locale=PLAYWRIGHT_DEFAULT_LOCALE, storage_state=None):
+    """
+    Create an isolated browser context with a single configured page (async API).
+    `storage_state` starts the context from a saved (logged in) state.
+
+    Returns:
+        tuple: (BrowserContext, Page)
+    """
+    context = await browser.new_context(locale=locale, viewport=get_viewport(), storage_state=storage_state)
+    route_layer = get_route_layer()
+    if route_layer:
+        await route_layer.attach_async(context)
+    page = await context.new_page()
+    page.set_default_timeout(PLAYWRIGHT_PAGE_DEFAULT_TIMEOUT_MS)
+    return context, page
+
+
+class AsyncChromeBrowser(Logger):
+    browser_type = "chromium"
+
+    def __init__(self, logger=__file__):
+        super().__init__(logger)
+        self.playwright = None
+        self.browser = None
+        self.page = None
+
+    @property
+    def driver_ws_url(self):
+        """CDP endpoint, resolved only when a remote browser is requested."""
+        return DriverWebSocket().get_websocket_debugger_url()
+
+    async def launch(self):
+        """Start Playwright and launch a local browser without opening any context."""
+        self.playwright = await async_playwright().start()
+        options = get_launch_options(self.browser_type)
+        self.logger.info(f"Launching {self.browser_type} with profile '{browser_profile}': {options}")
+        self.browser = await getattr(self.playwright, self.browser_type).launch(**options)
+        return self.browser
+
+    async def connect(self):
+        """Start Playwright and connect to the remote browser over CDP."""
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.connect_over_cdp(self.driver_ws_url)
+        return self.browser
+
+    async def run_browser(self, locale=PLAYWRIGHT_DEFAULT_LOCALE):
+        await self.launch()
+        _context, self.page = await new_async_page_context(self.browser, locale)
+        return self.browser, self.page
+
+    async def run_remote_browser(self):
+        await self.connect()
+        context = self.browser.contexts[0]
+        self.page = await context.new_page()
+        return self.browser, self.page
+
+    async def new_page(self, locale=PLAYWRIGHT_DEFAULT_LOCALE, storage_state=None):
+        """Open another isolated context/page on the already running browser."""
+        _context, page = await new_async_page_context(self.browser, locale, storage_state)
+        return page
+
+    async def close_browser(self):
+        if self.page:
+            await self.page.close()
+        if self.browser:
+            await self.browser.close()
+        if self.playwright:
+            await self.playwright.stop()
+
+
+class AsyncFireFoxBrowser(AsyncChromeBrowser):
+    browser_type = "firefox"
+
+
+async def get_async_browser(browser_type=browser):
+    """
+    Async counterpart of BrowserFactory: start the browser configured by BROWSER.
+
+    Returns:
+        AsyncChromeBrowser | AsyncFireFoxBrowser: Launcher holding the running browser and its first page.
+    """
+    if browser_type not in BROWSERS:
+        raise Exception("No Such Browser")
+    if browser_type in (FIREFOX_BROWSER, REMOTE_FIREFOX_BROWSER):
+        launcher = AsyncFireFoxBrowser()
+    else:
+        launcher = AsyncChromeBrowser()
+    if browser_type in (CHROME_BROWSER, FIREFOX_BROWSER):
+        await launcher.run_browser(localization or PLAYWRIGHT_DEFAULT_LOCALE)
+    elif browser_type in (REMOTE_CHROME_BROWSER, REMOTE_FIREFOX_BROWSER):
+        await launcher.run_remote_browser()
+    return launcher
@@ -0,0 +1,364 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+
+import datetime
+import os
+from abc import ABC
+from typing import List, Dict, Any, Optional
+from playwright.async_api import Page, Frame, Locator
+
+from framework_inject.constants import DEFAULT_WAIT_TIME_MS, LOG_TIME_STRUCTURE
+from framework_inject.base.base_page import locator_first
+from framework_inject.base.scripts import EXTRACT_ROWS_JS, EXTRACT_NAMED_JS
+from framework_inject.logger.logger import Logger
+from framework_inject.logger.log_context import set_log_context
+from framework_inject.page_metrics import metrics as page_metrics
+from framework_inject.step_timing import timed, last_step
+
+
+class AsyncBasePage(ABC, Logger):
+    """
+    asyncio-native counterpart of BasePage built on playwright.async_api.
+
+    Every instance drives its own page, so many page objects can run concurrently on one event loop.
+    Instances are not registered as Context()["I"], which is a single process-wide slot.
+    """
+
+    def __init__(self, page: Page, logger=__file__):
+        super().__init__(logger)
+        self.page = page
+        self.locator_first = locator_first
+
+    async def goto(self, url):
+        await self._goto(url)
+        if page_metrics is not None:
+            await page_metrics.collect_async(self.page, url, type(self).__name__, last_step())
+
+    @timed(action="goto", target="url")
+    async def _goto(self, url):
+        set_log_context(page=type(self).__name__)
+        await self.page.goto(url)
+
+    async def set_auth_token(self, token: str) -> None:
+        """
+        Set an authorization token in localStorage and refresh the page.
+        """
+        self.logger.debug("Set an authorization token")
+        await self.page.evaluate(f"window.localStorage.setItem('token', '{token}');")
+        await self.page.reload()
+
+    async def get_cookies(self) -> List[Dict[str, Any]]:
+        """
+        Get the cookies from the browser context.
+        """
+        return await self.page.context.cookies()
+
+    async def get_element(self, selector: str, frame: Optional[Frame] | Optional[Locator] = None, prev_elem=None) \
+            -> Locator:
+        """
+        Get a single element on the page or in a specific frame.
+
+        Args:
+            selector (str): The selector for the element.
+            frame (Frame, optional): The specific frame to search in. Defaults to the main page.
+
+        Returns:
+            Optional[Locator]: The element if found, None otherwise.
+        """
+        target = frame or self.page
+
+        try:
+            if prev_elem:
+                return prev_elem.locator(selector)
+            elif await self.wait_for_element_conditional(selector, frame=frame):
+                return target.locator(selector)
+            return None
+        except Exception as e:
+            self.logger.debug("Error getting element from '%s': %s", selector, e)
+            return None
+
+    async def get_elements_list(self, selector: str, element: Optional[Any] = None, frame: Optional[Frame] = None):
+        """
+        Get a list of elements on the page, in a specific frame, or within a given element.
+
+        Args:
+            selector (str): The selector for the elements.
+            element (Optional[Locator], optional): The parent element to search within. Defaults to None (page level).
+            frame (Frame, optional): The specific frame to search in. Defaults to the main page.
+
+        Returns:
+            List[Locator]: A list of elements matching the selector.
+        """
+        target = frame or self.page
+        parent = element or target
+
+        try:
+            if await self.wait_for_element_conditional(selector, frame=frame):
+                return await parent.locator(selector).all()
+            return []
+        except Exception as e:
+            self.logger.debug("Error getting elements list from '%s': %s", selector, e)
+            return []
+
+    @timed(target="selector")
+    async def get_elements_data(self, selector: str | Dict[str, str], fields: str | list | Dict[str, Any] = "text",
+                                frame: Optional[Frame] = None, prev_elem: Optional[Locator] = None,
+                                wait: bool = True) -> List[Any] | Dict[str, List[Any]]:
+        """
+        Read text/attributes of many elements in a single browser round-trip. See BasePage.get_elements_data.
+        """
+        target = frame or self.page
+        parent = prev_elem or target
+        named = isinstance(selector, dict)
+        wait_selector = next(iter(selector.values()), None) if named else selector
+
+        try:
+            if wait and wait_selector and \
+                    not await self.wait_for_element_conditional(wait_selector, frame=frame, prev_elem=prev_elem):
+                return {name: [] for name in selector} if named else []
+            if named:
+                return await parent.evaluate(EXTRACT_NAMED_JS, {"selectors": selector, "fields": fields})
+            return await parent.locator(selector).evaluate_all(EXTRACT_ROWS_JS, fields)
+        except Exception as e:
+            self.logger.debug("Error extracting data from '%s': %s", selector, e)
+            return {name: [] for name in selector} if named else []
+
+    @timed(target="selector", wait=True)
+    async def wait_for_element(self, selector: str, time: int | float = DEFAULT_WAIT_TIME_MS,
+                               frame: Optional[Frame] = None, state=None):
+        """
+        Wait for an element to appear on the page or in a specific frame.
+        """
+        target = frame or self.page
+        await target.wait_for_selector(selector, timeout=time, state=state)
+
+    @timed(target="selector", wait=True)
+    async def wait_for_element_conditional(self, selector: str,
+                                           time: int | float = DEFAULT_WAIT_TIME_MS,
+                                           frame: Optional[Frame] = None,
+                                           state=None,
+                                           prev_elem: Optional[Locator] = None) -> bool:
+        """
+        Wait for an element to appear on the page or in a specific frame, conditionally based on a previous element.
+
+        Args:
+            selector (str): The selector of the target element to wait for.
+            time (int | float): Timeout in milliseconds.
+            frame (Optional[Frame]): Frame to look for the selector, if applicable.
+            state: The state of the element to wait for ('attached', 'visible', etc.).
+            prev_elem (Optional[Locator]): Previously located element to check first.
+
+        Returns:
+            bool: True if the element appears within the timeout, False otherwise.
+        """
+        target = frame or self.page
+        try:
+            if prev_elem:
+                return await prev_elem.locator(selector).is_visible()
+            await target.wait_for_selector(selector, timeout=time, state=state)
+            return True
+        except Exception as e:
+            self.logger.debug("Exception: %s", e)
+            return False
+
+    async def get_iframe(self, iframe_selector: str, parent_frame: Optional[Frame] = None) -> Frame:
+        """
+        Returns the iframe element (handles both top-level and nested iframes).
+        """
+        target = parent_frame or self.page
+        iframe_element = await target.wait_for_selector(iframe_selector)
+        return await iframe_element.content_frame()
+
+    async def get_nested_iframe(self, selectors: list) -> Frame:
+        """
+        Traverses nested iframes and returns the innermost Frame.
+        """
+        current_frame = None
+        for selector in selectors:
+            current_frame = await self.get_iframe(selector, parent_frame=current_frame)
+        return current_frame
+
+    def connect_selectors(self, selectors: list, frame: Optional[Frame] = None):
+        target = frame or self.page
+        for selector in selectors:
+            target = target.locator(selector)
+        return target
+
+    def _locator(self, selector: str, frame: Optional[Frame] = None) -> Locator:
+        """
+        Resolve a selector once for locator-first interactions. Uses the first match, like page.click(selector).
+        """
+        target = frame or self.page
+        return target.locator(selector).first
+
+    @timed(target="selector")
+    async def click(self, selector: str, frame: Optional[Frame] = None):
+        """
+        Click an element on the page or in a specific frame.
+        In locator-first mode the click's own actionability check is the only wait.
+        """
+        if self.locator_first:
+            await self._locator(selector, frame).click()
+            return
+        target = frame or self.page
+        await self.wait_for_element(selector, frame=frame)
+        await target.click(selector)
+
+    @timed(target="locator")
+    async def force_click(self, locator: str, frame: Optional[Frame] = None) -> bool:
+        """
+        Forces a click on the element by evaluating JavaScript if necessary.
+
+        Args:
+            locator (str): The selector for the element to click.
+            frame (Frame, optional): The specific frame to perform the click in. Defaults to the main page.
+
+        Returns:
+            bool: True if the click is successful, False otherwise.
+        """
+        target = frame or self.page
+
+        try:
+            if await self.wait_for_element_conditional(locator, frame=frame):
+                element = await target.query_selector(locator)
+                if element:
+                    self.logger.debug("Trying to JS (force) click on element: %s", locator)
+
+                    is_visible = await element.is_visible()
+                    is_enabled = await element.is_enabled()
+
+                    if not is_visible or not is_enabled:
+                        self.logger.debug("Element found but not interactable (visible: %s, enabled: %s): %s", is_visible, is_enabled, locator)
+                        return False
+
+                    await target.evaluate("element => element.click()", element)
+                    self.logger.debug("Successfully clicked element: %s", locator)
+                    return True
+                else:
+                    self.logger.debug("Element not found for locator: %s", locator)
+                    return False
+            else:
+                self.logger.debug("Element not found or timed out for locator: %s", locator)
+                return False
+        except Exception as e:
+            self.logger.debug("Unexpected error during force click: %s", e)
+            return False
+
+    @timed(target="selector")
+    async def scroll_and_click(self, selector: str, frame: Optional[Frame] = None):
+        """Scrolls to an element and clicks it."""
+        if self.locator_first:
+            await self._locator(selector, frame).click()
+            return
+        await self.scroll_page(selector, frame)
+        await self.move_and_click(selector, frame)
+
+    async def scroll_page(self, selector: str, frame: Optional[Frame] = None):
+        """Scrolls to the element."""
+        target = frame or self.page
+        await target.locator(selector).first.scroll_into_view_if_needed()
+
+    @timed(target="selector")
+    async def move_and_click(self, selector: str, frame: Optional[Frame] = None):
+        if self.locator_first:
+            await self._locator(selector, frame).click()
+            return
+        await self.move_mouse_to(selector, frame)
+        await self.click(selector, frame)
+
+    @timed(target="selector")
+    async def fill_text(self, selector: str, text: str, frame: Optional[Frame] = None):
+        """
+        Fill a text field on the page or in a specific frame.
+        """
+        if self.locator_first:
+            await self._locator(selector, frame).fill(text)
+            return
+        target = frame or self.page
+        await self.wait_for_element(selector, frame=frame)
+        await target.fill(selector, text)
+
+    async def move_mouse_to(self, selector: str, frame: Optional[Frame] = None):
+        """
+        Move the mouse pointer to an element on the page or in a specific frame.
+        """
+        if self.locator_first:
+            await self._locator(selector, frame).hover()
+            return
+        target = frame or self.page
+        await self.wait_for_element(selector, frame=frame)
+        bounding_box = await target.locator(selector).bounding_box()
+        if bounding_box:
+            x = bounding_box["x"] + bounding_box["width"] / 2
+            y = bounding_box["y"] + bounding_box["height"] / 2
+            await self.page.mouse.move(x, y)
+
+    @timed(target="selector")
+    async def click_and_fill_text(self, selector: str, text: str, frame: Optional[Frame] = None):
+        if self.locator_first:
+            element = self._locator(selector, frame)
+            await element.click()
+            await element.fill(text)
+            return
+        await self.move_mouse_to(selector, frame)
+        await self.click(selector, frame)
+        await self.fill_text(selector, text, frame)
+
+    @timed(target="tag")
+    async def capture_full_page_screenshot(self, folder: str = "logs/screenshots", file_name: Optional[str] = None,
+                                           tag: Optional[str] = None):
+        """
+        Capture a screenshot of the entire page and save it to a specified folder.
+
+        Args:
+            folder (str): The folder where the screenshot will be saved.
+            file_name (Optional[str]): The name of the screenshot file. If not provided, a timestamped name will be used.
+        """
+        os.makedirs(folder, exist_ok=True)
+
+        if not tag:
+            tag = "screenshot"
+        if not file_name:
+            file_name = datetime.datetime.now().strftime(f"{LOG_TIME_STRUCTURE}-{tag}.png")
+        elif not file_name.endswith(".png"):
+            file_name += ".png"
+
+        file_path = os.path.join(folder, file_name)
+
+        try:
+            await self.page.screenshot(path=file_path, full_page=True)
+            self.logger.info("Full page screenshot saved to %s", file_path)
+        except Exception as e:
+            self.logger.debug("Error capturing full page screenshot: %s", e)
+
+    @timed(target="selector")
+    async def get_element_text(self, selector: str, frame: Optional[Frame] = None,
+                               prev_elem: Optional[Locator] = None) -> Optional[str]:
+        """
+        Retrieve the text content of an element on the page or within a specific frame.
+
+        Args:
+            selector (str): The selector for the element.
+            frame (Frame, optional): The specific frame to search in. Defaults to the main page.
+            prev_elem (Locator, optional): Parent element to search within.
+
+        Returns:
+            Optional[str]: The text content of the element if found, None otherwise.
+        """
+        target = frame or self.page
+        try:
+            if prev_elem:
+                element = prev_elem.locator(selector)
+            else:
+                element = target.locator(selector)
+            if self.locator_first:
+                return (await element.inner_text(timeout=DEFAULT_WAIT_TIME_MS)).strip()
+            try:
+                await element.wait_for(timeout=DEFAULT_WAIT_TIME_MS)
+            except Exception as e:
+                self.logger.debug("Element not found or timed out for selector: %s (%s)", selector, e)
+                return None
+            return (await element.inner_text()).strip()
+        except Exception as e:
+            self.logger.debug("Error retrieving text from element '%s': %s", selector, e)
+            return None
@@ -4,23 +4,103 @@
 import datetime
 import os
 from abc import ABC
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from playwright.sync_api import Page, Frame, Locator
 
-from framework_inject.browser import RunBrowser
+from framework_inject.browser import RunBrowser, ensure_storage_state
+from framework_inject.browser_pool import BrowserPool, PageSlot
 from framework_inject.constants import DEFAULT_WAIT_TIME_MS, LOG_TIME_STRUCTURE
 from framework_inject.logger.logger import Logger
+from framework_inject.logger.log_context import set_log_context
+from framework_inject.page_metrics import metrics as page_metrics
+from framework_inject.step_timing import timed, last_step
+from framework_inject.storage_state import StorageStateStore
 from framework_inject.base.context import Context
+from framework_inject.base.locator_cache import LocatorCache
+from framework_inject.base.scripts import EXTRACT_ROWS_JS, EXTRACT_NAMED_JS
+
+locator_first = os.getenv("LOCATOR_FIRST", "False").lower() == "true"
+locator_cache = os.getenv("LOCATOR_CACHE", "False").lower() == "true"
+locator_cache_observe_dom = os.getenv("LOCATOR_CACHE_OBSERVE_DOM", "False").lower() == "true"
 
 
 class BasePage(ABC, Logger):
-    def __init__(self, logger=__file__):
+    def __init__(self, logger=__file__, page: Optional[Page] = None):
         super().__init__(logger)
         self.context = Context()
         self.context["I"] = self
-        self.page = RunBrowser().page
+        self._page = page
+        self.slot: Optional[PageSlot] = None
+        self.locator_first = locator_first
+        self.use_locator_cache = locator_cache
+        self._locator_cache: Optional[LocatorCache] = None
+
+    @property
+    def page(self) -> Page:
+        """The page driven by this object: an explicit/pooled page, or the global RunBrowser page."""
+        return self._page or RunBrowser().page
+
+    @page.setter
+    def page(self, new_page: Optional[Page]) -> None:
+        self._page = new_page
+
+    @property
+    def locator_cache(self) -> Optional[LocatorCache]:
+        """Frame/locator cache of the current page, None when LOCATOR_CACHE is disabled."""
+        if not self.use_locator_cache:
+            return None
+        page = self.page
+        if self._locator_cache is None or self._locator_cache.page is not page:
+            self._locator_cache = LocatorCache(page, observe_mutations=locator_cache_observe_dom)
+        return self._locator_cache
+
+    def checkout_page(self, pool: Optional[BrowserPool] = None, timeout: Optional[float] = None,
+                      user: Optional[str] = None, login: Optional[Callable[[Page], None]] = None,
+                      env: Optional[str] = None) -> Page:
+        """
+        Check out an isolated context/page from the browser pool and drive it with this page object.
+
+        Args:
+            pool (BrowserPool, optional): Pool to use. Defaults to the process-wide BrowserPool().
+            timeout (float, optional): Seconds to wait for a free slot. By default an exhausted pool
+                raises TimeoutError at once.
+            user (str, optional): Start the page from the saved storage state of this user.
+            login (Callable[[Page], None], optional): Login flow run once (in its own context) when the
+                user's state is missing or expired; the resulting state is saved for later checkouts.
+            env (str, optional): Environment key of the state. Defaults to STORAGE_STATE_ENV.
+
+        Returns:
+            Page: The checked out page.
+        """
+        if self.slot:
+            return self.slot.page
+        pool = pool or BrowserPool()
+        storage_state = None
+        if user:
+            storage_state = ensure_storage_state(pool.browser, user, login, env, locale=pool.locale) if login \
+                else StorageStateStore().load(user, env)
+        self.slot = pool.acquire(timeout, storage_state=storage_state)
+        self._page = self.slot.page
+        return self._page
+
+    def return_page(self, recycle: bool = True) -> None:
+        """
+        Return the checked out page to its pool and fall back to the global RunBrowser page.
+        """
+        if self.slot:
+            self.slot.release(recycle=recycle)
+            self.slot = None
+            self._page = None
 
     def goto(self, url):
+        self._goto(url)
+        # Outside the timed step, so reading the metrics does not count as navigation time
+        if page_metrics is not None:
+            page_metrics.collect(self.page, url, type(self).__name__, last_step())
+
+    @timed(action="goto", target="url")
+    def _goto(self, url):
+        set_log_context(page=type(self).__name__)
         self.page.goto(url)
 
     def set_auth_token(self, token: str) -> None:
@@ -31,6 +111,16 @@ class BasePage(ABC, Logger):
         self.page.evaluate(f"window.localStorage.setItem('token', '{token}');")
         self.page.reload()
 
+    def save_storage_state(self, user: str, env: Optional[str] = None) -> str:
+        """
+        Save cookies and localStorage of the current context (e.g. after a login scenario),
+        so new contexts can start from it instead of logging in again.
+
+        Returns:
+            str: Path of the saved state.
+        """
+        return StorageStateStore().save(self.page.context, user, env)
+
     def get_cookies(self) -> List[Dict[str, Any]]:
         """
         Get the cookies from the browser context.
@@ -56,11 +146,12 @@ class BasePage(ABC, Logger):
                 element = prev_elem.locator(selector)
                 return element
             elif self.wait_for_element_conditional(selector, frame=frame):
+                # Not cached: the wait above is the cost here, and building a Locator is free
                 element = target.locator(selector)
                 return element
             return None
         except Exception as e:
-            self.logger.debug(f"Error getting element from '{selector}': {str(e)}")
+            self.logger.debug("Error getting element from '%s': %s", selector, e)
             return None
 
     def get_elements_list(self, selector: str, element: Optional[Any] = None, frame: Optional[Frame] = None):
@@ -74,22 +165,63 @@ class BasePage(ABC, Logger):
 
         Returns:
             List[ElementHandle]: A list of elements matching the selector.
+
+        Note:
+            Reading each returned element costs a round-trip; use `get_elements_data` to read many at once.
         """
         target = frame or self.page
         parent = element or target
 
         try:
-            # Wait for the element (or the frame/parent element) and query the list
-            # parent.locator("//div[contains(@class, 'blackjackCardsStack__card')]").all()
-
             if self.wait_for_element_conditional(selector, frame=frame):
                 elements = parent.locator(selector).all()
                 return elements
             return []
         except Exception as e:
-            self.logger.debug(f"Error getting elements list from '{selector}': {str(e)}")
+            self.logger.debug("Error getting elements list from '%s': %s", selector, e)
             return []
 
+    @timed(target="selector")
+    def get_elements_data(self, selector: str | Dict[str, str], fields: str | list | Dict[str, Any] = "text",
+                          frame: Optional[Frame] = None, prev_elem: Optional[Locator] = None, wait: bool = True) \
+            -> List[Any] | Dict[str, List[Any]]:
+        """
+        Read text/attributes of many elements in a single browser round-trip.
+
+        Args:
+            selector (str | dict): Selector of the rows, or a dict of named selectors.
+            fields (str | list | dict): What to read from every element: "text", "text_content", "html", "value",
+                "@attribute", a DOM property name, or [sub_selector, spec] to read from a descendant.
+                A dict of such specs returns one dict per element.
+            frame (Frame, optional): The specific frame to search in. Defaults to the main page.
+            prev_elem (Locator, optional): Parent element to search within.
+            wait (bool): Wait for the (first) selector before reading. Defaults to True.
+
+        Returns:
+            list: One value/dict per element for a string selector.
+            dict: {name: list} for a dict of named selectors.
+
+        Example:
+            rows = self.get_elements_data("//table//tr", {"name": ["./td[1]", "text"], "link": ["a", "@href"]})
+            cards = self.get_elements_data("//div[contains(@class, 'blackjackCardsStack__card')]")
+        """
+        target = frame or self.page
+        parent = prev_elem or target
+        named = isinstance(selector, dict)
+        wait_selector = next(iter(selector.values()), None) if named else selector
+
+        try:
+            if wait and wait_selector and \
+                    not self.wait_for_element_conditional(wait_selector, frame=frame, prev_elem=prev_elem):
+                return {name: [] for name in selector} if named else []
+            if named:
+                return parent.evaluate(EXTRACT_NAMED_JS, {"selectors": selector, "fields": fields})
+            return parent.locator(selector).evaluate_all(EXTRACT_ROWS_JS, fields)
+        except Exception as e:
+            self.logger.debug("Error extracting data from '%s': %s", selector, e)
+            return {name: [] for name in selector} if named else []
+
+    @timed(target="selector", wait=True)
     def wait_for_element(self, selector: str, time: int | float = DEFAULT_WAIT_TIME_MS, frame: Optional[Frame] = None,
                          state=None):
         """
@@ -98,6 +230,7 @@ class BasePage(ABC, Logger):
         target = frame or self.page
         target.wait_for_selector(selector, timeout=time, state=state)
 
+    @timed(target="selector", wait=True)
     def wait_for_element_conditional(self, selector: str,
                                      time: int | float = DEFAULT_WAIT_TIME_MS,
                                      frame: Optional[Frame] = None,
@@ -124,40 +257,74 @@ class BasePage(ABC, Logger):
             target.wait_for_selector(selector, timeout=time, state=state)
             return True
         except Exception as e:
-            self.logger.debug(f"Exception: {e}")
+            self.logger.debug("Exception: %s", e)
             return False
 
     def get_iframe(self, iframe_selector: str, parent_frame: Optional[Frame] = None) -> Frame:
         """
         Returns the iframe element (handles both top-level and nested iframes).
+        Resolved frames are cached per (parent frame, selector) until navigation or detach.
         """
         target = parent_frame or self.page
-        iframe_element = target.wait_for_selector(iframe_selector)
-        return iframe_element.content_frame()
+
+        def resolve():
+            iframe_element = target.wait_for_selector(iframe_selector)
+            return iframe_element.content_frame()
+
+        cache = self.locator_cache
+        if cache:
+            return cache.get_frame((parent_frame, iframe_selector), resolve)
+        return resolve()
 
     def get_nested_iframe(self, selectors: list) -> Frame:
         """
         Traverses nested iframes and returns the innermost Frame.
+        A cached chain is returned without walking (or waiting on) any level.
         """
-        current_frame = None
-        for selector in selectors:
-            current_frame = self.get_iframe(selector, parent_frame=current_frame)
-        return current_frame
+        def resolve():
+            current_frame = None
+            for selector in selectors:
+                current_frame = self.get_iframe(selector, parent_frame=current_frame)
+            return current_frame
+
+        cache = self.locator_cache
+        if cache:
+            return cache.get_frame((None, tuple(selectors)), resolve)
+        return resolve()
 
     def connect_selectors(self, selectors: list, frame: Optional[Frame] = None):
+        def resolve():
+            target = frame or self.page
+            for selector in selectors:
+                target = target.locator(selector)
+            return target
+
+        cache = self.locator_cache
+        if cache:
+            return cache.get_locator((frame, tuple(selectors)), resolve)
+        return resolve()
+
+    def _locator(self, selector: str, frame: Optional[Frame] = None) -> Locator:
+        """
+        Resolve a selector once for locator-first interactions. Uses the first match, like page.click(selector).
+        """
         target = frame or self.page
-        for selector in selectors:
-            target = target.locator(selector)
-        return target
+        return target.locator(selector).first
 
+    @timed(target="selector")
     def click(self, selector: str, frame: Optional[Frame] = None):
         """
         Click an element on the page or in a specific frame.
+        In locator-first mode the click's own actionability check is the only wait.
         """
+        if self.locator_first:
+            self._locator(selector, frame).click()
+            return
         target = frame or self.page
         self.wait_for_element(selector, frame=frame)
         target.click(selector)
 
+    @timed(target="locator")
     def force_click(self, locator: str, frame: Optional[Frame] = None) -> bool:
         """
         Forces a click on the element by evaluating JavaScript if necessary.
@@ -176,32 +343,37 @@ class BasePage(ABC, Logger):
             if self.wait_for_element_conditional(locator, frame=frame):
                 element = target.query_selector(locator)  # TODO: ??? Locator()?
                 if element:
-                    self.logger.debug(f"Trying to JS (force) click on element: {locator}")
+                    self.logger.debug("Trying to JS (force) click on element: %s", locator)
 
                     # Check if element is interactable (visible and enabled)
                     is_visible = element.is_visible()
                     is_enabled = element.is_enabled()
 
                     if not is_visible or not is_enabled:
-                        self.logger.debug(f"Element found but not interactable (visible: {is_visible}, enabled: {is_enabled}): {locator}")
+                        self.logger.debug("Element found but not interactable (visible: %s, enabled: %s): %s", is_visible, is_enabled, locator)
                         return False
 
                     # Try force-clicking using JavaScript
                     target.evaluate("element => element.click()", element)
-                    self.logger.debug(f"Successfully clicked element: {locator}")
+                    self.logger.debug("Successfully clicked element: %s", locator)
                     return True
                 else:
-                    self.logger.debug(f"Element not found for locator: {locator}")
+                    self.logger.debug("Element not found for locator: %s", locator)
                     return False
             else:
-                self.logger.debug(f"Element not found or timed out for locator: {locator}")
+                self.logger.debug("Element not found or timed out for locator: %s", locator)
                 return False
         except Exception as e:
-            self.logger.debug(f"Unexpected error during force click: {str(e)}")
+            self.logger.debug("Unexpected error during force click: %s", e)
             return False
 
+    @timed(target="selector")
     def scroll_and_click(self, selector: str, frame: Optional[Frame] = None):
         """Scrolls to an element and clicks it."""
+        if self.locator_first:
+            # click() scrolls the element into view and moves the mouse itself
+            self._locator(selector, frame).click()
+            return
         self.scroll_page(selector, frame)
         self.move_and_click(selector, frame)
 
@@ -214,14 +386,22 @@ class BasePage(ABC, Logger):
             self.page.locator(selector).first.scroll_into_view_if_needed()
             # self.page.evaluate(f"document.querySelector('{selector}').scrollIntoView()")
 
+    @timed(target="selector")
     def move_and_click(self, selector: str, frame: Optional[Frame] = None):
+        if self.locator_first:
+            self._locator(selector, frame).click()
+            return
         self.move_mouse_to(selector, frame)
         self.click(selector, frame)
 
+    @timed(target="selector")
     def fill_text(self, selector: str, text: str, frame: Optional[Frame] = None):
         """
         Fill a text field on the page or in a specific frame.
         """
+        if self.locator_first:
+            self._locator(selector, frame).fill(text)
+            return
         target = frame or self.page
         self.wait_for_element(selector, frame=frame)
         target.fill(selector, text)
@@ -230,6 +410,9 @@ class BasePage(ABC, Logger):
         """
         Move the mouse pointer to an element on the page or in a specific frame.
         """
+        if self.locator_first:
+            self._locator(selector, frame).hover()
+            return
         target = frame or self.page
         self.wait_for_element(selector, frame=frame)
         element = target.locator(selector)
@@ -239,11 +422,19 @@ class BasePage(ABC, Logger):
             y = bounding_box["y"] + bounding_box["height"] / 2
             self.page.mouse.move(x, y)
 
+    @timed(target="selector")
     def click_and_fill_text(self, selector: str, text: str, frame: Optional[Frame] = None):
+        if self.locator_first:
+            # One resolution; click() already moves the mouse to the element
+            element = self._locator(selector, frame)
+            element.click()
+            element.fill(text)
+            return
         self.move_mouse_to(selector, frame)
         self.click(selector, frame)
         self.fill_text(selector, text, frame)
 
+    @timed(target="tag")
     def capture_full_page_screenshot(self, folder: str = "logs/screenshots", file_name: Optional[str] = None,
                                      tag: Optional[str]= None):
         """
@@ -270,10 +461,11 @@ class BasePage(ABC, Logger):
 
         try:
             self.page.screenshot(path=file_path, full_page=True)
-            self.logger.info(f"Full page screenshot saved to {file_path}")
+            self.logger.info("Full page screenshot saved to %s", file_path)
         except Exception as e:
-            self.logger.debug(f"Error capturing full page screenshot: {str(e)}")
+            self.logger.debug("Error capturing full page screenshot: %s", e)
 
+    @timed(target="selector")
     def get_element_text(self, selector: str, frame: Optional[Frame] = None, prev_elem: Optional[Locator] = None) -> Optional[str]:
         """
         Retrieve the text content of an element on the page or within a specific frame.
@@ -292,12 +484,16 @@ class BasePage(ABC, Logger):
                 element = prev_elem.locator(selector)
             else:
                 element = target.locator(selector)
-            if self.wait_for_element_conditional(selector, frame=frame):
-                return element.inner_text().strip()
-            else:
-                self.logger.debug(f"Element not found or timed out for selector: {selector}")
+            if self.locator_first:
+                return element.inner_text(timeout=DEFAULT_WAIT_TIME_MS).strip()
+            # Wait on the resolved element itself, so `prev_elem` scoping is respected
+            try:
+                element.wait_for(timeout=DEFAULT_WAIT_TIME_MS)
+            except Exception as e:
+                self.logger.debug("Element not found or timed out for selector: %s (%s)", selector, e)
                 return None
+            return element.inner_text().strip()
         except Exception as e:
-            self.logger.debug(f"Error retrieving text from element '{selector}': {str(e)}")
+            self.logger.debug("Error retrieving text from element '%s': %s", selector, e)
             return None
 
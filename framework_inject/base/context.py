@@ -18,6 +18,11 @@ class Context:
             cls._instance.data = {}
         return cls._instance
 
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the shared instance so the next Context() starts empty (e.g. in a fresh worker process)."""
+        cls._instance = None
+
     def __init__(self):
         self._data = {}
 
@@ -0,0 +1,101 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from playwright.sync_api import Page, Frame
+
+from framework_inject.base.scripts import DOM_MUTATION_BINDING, IFRAME_MUTATION_OBSERVER_JS
+from framework_inject.logger.logger import Logger
+
+
+class LocatorCache(Logger):
+    """
+    Per-page cache of resolved frames and locators keyed by (frame, selector).
+
+    Entries are dropped when the main frame navigates, when a frame detaches and, optionally,
+    when a MutationObserver reports that iframes were added to or removed from a document.
+    Cached frames are also checked with `is_detached()` (no browser round-trip) on every hit.
+    Off by default (LOCATOR_CACHE=True enables it): Playwright locators are lazy and cheap to build, so the
+    cache mostly pays off for pages with deep iframe chains.
+    """
+
+    def __init__(self, page: Page, observe_mutations: bool = False, logger=__file__):
+        super().__init__(logger)
+        self.page = page
+        self.hits = 0
+        self.misses = 0
+        self._frames: Dict[Hashable, Frame] = {}
+        self._locators: Dict[Hashable, Any] = {}
+        page.on("framenavigated", self._on_frame_navigated)
+        page.on("framedetached", self._on_frame_detached)
+        if observe_mutations:
+            self._observe_mutations()
+
+    def _observe_mutations(self) -> None:
+        try:
+            self.page.expose_binding(DOM_MUTATION_BINDING, self._on_frames_mutated)
+            self.page.add_init_script(IFRAME_MUTATION_OBSERVER_JS)
+            for frame in self.page.frames:
+                frame.evaluate(IFRAME_MUTATION_OBSERVER_JS)
+        except Exception as e:
+            self.logger.debug("Could not install DOM mutation observer: %s", e)
+
+    def get_frame(self, key: Hashable, resolve: Callable[[], Optional[Frame]]) -> Optional[Frame]:
+        """
+        Return the cached frame for `key`, or resolve, store and return it.
+        """
+        frame = self._frames.get(key)
+        if frame is not None and not frame.is_detached():
+            self.hits += 1
+            return frame
+        self.misses += 1
+        frame = resolve()
+        if frame is not None:
+            self._frames[key] = frame
+        return frame
+
+    def get_locator(self, key: Hashable, resolve: Callable[[], Any]) -> Any:
+        """
+        Return the cached locator for `key`, or build, store and return it.
+        """
+        target = key[0] if isinstance(key, tuple) else None
+        locator = self._locators.get(key)
+        if locator is not None and not (isinstance(target, Frame) and target.is_detached()):
+            self.hits += 1
+            return locator
+        self.misses += 1
+        locator = resolve()
+        self._locators[key] = locator
+        return locator
+
+    def invalidate(self, frame: Optional[Frame] = None) -> None:
+        """
+        Drop every entry, or only the entries that belong to or point at `frame`.
+        """
+        if frame is None:
+            self._frames.clear()
+            self._locators.clear()
+            return
+        self._frames = {key: value for key, value in self._frames.items()
+                        if value is not frame and not self._key_uses(key, frame)}
+        self._locators = {key: value for key, value in self._locators.items() if not self._key_uses(key, frame)}
+
+    @staticmethod
+    def _key_uses(key: Hashable, frame: Frame) -> bool:
+        return isinstance(key, tuple) and key[0] is frame
+
+    def _on_frame_navigated(self, frame: Frame) -> None:
+        if frame == self.page.main_frame:
+            self.invalidate()
+        else:
+            self.invalidate(frame)
+
+    def _on_frame_detached(self, frame: Frame) -> None:
+        self.invalidate(frame)
+
+    def _on_frames_mutated(self, source: Dict[str, Any]) -> None:
+        frame = source.get("frame")
+        if frame is None or frame == self.page.main_frame:
+            self._frames.clear()
+        else:
+            self.invalidate(frame)
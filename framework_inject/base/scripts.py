@@ -0,0 +1,134 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+# JavaScript snippets evaluated in the browser by page objects.
+
+DOM_MUTATION_BINDING = "__injectFramesMutated"
+
+# Reports (at most once per animation frame) that an <iframe> was added to or removed from the document,
+# which is the only DOM change that can invalidate cached Frame objects.
+IFRAME_MUTATION_OBSERVER_JS = '''
+(() => {
+    if (window.__injectFrameObserver || typeof window.%(binding)s !== "function") {
+        return;
+    }
+    let scheduled = false;
+    const touchesFrames = nodes => Array.from(nodes).some(node =>
+        node.nodeType === 1 && (node.tagName === "IFRAME" || node.querySelector("iframe")));
+    const start = () => {
+        window.__injectFrameObserver = new MutationObserver(records => {
+            if (scheduled) {
+                return;
+            }
+            if (records.some(r => touchesFrames(r.addedNodes) || touchesFrames(r.removedNodes))) {
+                scheduled = true;
+                requestAnimationFrame(() => {
+                    scheduled = false;
+                    window.%(binding)s();
+                });
+            }
+        });
+        window.__injectFrameObserver.observe(document.documentElement, {childList: true, subtree: true});
+    };
+    if (document.documentElement) {
+        start();
+    } else {
+        document.addEventListener("DOMContentLoaded", start);
+    }
+})();
+''' % {"binding": DOM_MUTATION_BINDING}
+
+# Shared helpers for batched extraction. Selectors starting with "/", "./", "(" or "xpath=" are XPath,
+# everything else (optionally prefixed with "css=") is CSS. Field specs:
+#   "text" (trimmed innerText), "text_content", "html", "value", "@attr" (attribute), any other DOM property,
+#   or [sub_selector, spec] to read from the first descendant of the element.
+_EXTRACT_HELPERS_JS = '''
+    const isXPath = selector => selector.startsWith("xpath=") || /^(\\/|\\.\\/|\\.\\.|\\()/.test(selector);
+    const stripPrefix = selector => selector.replace(/^(xpath|css)=/, "");
+    const queryAll = (root, selector) => {
+        const doc = root.ownerDocument || root;
+        if (isXPath(selector)) {
+            const snapshot = doc.evaluate(stripPrefix(selector), root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            return Array.from({length: snapshot.snapshotLength}, (_, i) => snapshot.snapshotItem(i));
+        }
+        return Array.from(root.querySelectorAll(stripPrefix(selector)));
+    };
+    const queryOne = (root, selector) => queryAll(root, selector)[0] || null;
+    const read = (el, spec) => {
+        if (Array.isArray(spec)) {
+            const child = el && queryOne(el, spec[0]);
+            return child ? read(child, spec[1]) : null;
+        }
+        if (!el) return null;
+        if (spec === "text") return (el.innerText ?? el.textContent ?? "").trim();
+        if (spec === "text_content") return el.textContent;
+        if (spec === "html") return el.innerHTML;
+        if (spec.startsWith("@")) return el.getAttribute(spec.slice(1));
+        const value = el[spec];
+        return value === undefined ? null : value;
+    };
+    const row = (el, fields) => (typeof fields === "string" || Array.isArray(fields))
+        ? read(el, fields)
+        : Object.fromEntries(Object.entries(fields).map(([name, spec]) => [name, read(el, spec)]));
+'''
+
+# Locator.evaluate_all(EXTRACT_ROWS_JS, fields) -> one row per matched element
+EXTRACT_ROWS_JS = '''
+(elements, fields) => {
+''' + _EXTRACT_HELPERS_JS + '''
+    return elements.map(el => row(el, fields));
+}
+'''
+
+# evaluate(EXTRACT_NAMED_JS, {"selectors": {...}, "fields": ...}) on a page/frame (root = document)
+# or on an element (root = element) -> {name: rows}
+EXTRACT_NAMED_JS = '''
+(rootOrArg, maybeArg) => {
+''' + _EXTRACT_HELPERS_JS + '''
+    const [root, arg] = maybeArg === undefined ? [document, rootOrArg] : [rootOrArg, maybeArg];
+    return Object.fromEntries(Object.entries(arg.selectors).map(
+        ([name, selector]) => [name, queryAll(root, selector).map(el => row(el, arg.fields))]));
+}
+'''
+
+# Navigation/Resource Timing, first contentful paint, LCP and CLS of the current document (times in ms).
+# LCP and CLS are read from the buffered performance entries, so no observer has to be installed before goto;
+# they are null where the browser does not support the entry type.
+PAGE_METRICS_JS = '''
+() => {
+    const nav = performance.getEntriesByType("navigation")[0];
+    const supported = PerformanceObserver.supportedEntryTypes || [];
+    const buffered = type => {
+        if (!supported.includes(type)) {
+            return null;
+        }
+        const observer = new PerformanceObserver(() => {});
+        observer.observe({type, buffered: true});
+        const entries = observer.takeRecords();
+        observer.disconnect();
+        return entries;
+    };
+    const lcp = buffered("largest-contentful-paint");
+    const shifts = buffered("layout-shift");
+    const paint = performance.getEntriesByName("first-contentful-paint")[0];
+    const resources = performance.getEntriesByType("resource");
+    const byType = {};
+    for (const r of resources) {
+        const stats = byType[r.initiatorType] = byType[r.initiatorType] || {count: 0, transfer_size: 0, max_duration: 0};
+        stats.count += 1;
+        stats.transfer_size += r.transferSize || 0;
+        stats.max_duration = Math.max(stats.max_duration, r.duration);
+    }
+    return {
+        ttfb: nav ? nav.responseStart - nav.startTime : null,
+        dom_content_loaded: nav ? nav.domContentLoadedEventEnd - nav.startTime : null,
+        load: nav && nav.loadEventEnd ? nav.loadEventEnd - nav.startTime : null,
+        transfer_size: nav ? nav.transferSize : null,
+        fcp: paint ? paint.startTime : null,
+        lcp: lcp && lcp.length ? lcp[lcp.length - 1].startTime : null,
+        cls: shifts ? shifts.filter(s => !s.hadRecentInput).reduce((sum, s) => sum + s.value, 0) : null,
+        resource_count: resources.length,
+        resource_transfer_size: resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+        resources: byType,
+    };
+}
+'''
@@ -2,14 +2,22 @@
 
 import http
 import os
+import time
 
-import requests
 from dotenv import load_dotenv
 from playwright.sync_api import sync_playwright
 
 from framework_inject.constants import DEFAULT_BROWSER_DEBUGGER_ADDRESS
 from framework_inject.constants import DEFAULT_VIEWPORT_SIZE, PLAYWRIGHT_PAGE_DEFAULT_TIMEOUT_MS, BROWSERS, \
-    CHROME_BROWSER, FIREFOX_BROWSER, REMOTE_CHROME_BROWSER, REMOTE_FIREFOX_BROWSER, PLAYWRIGHT_DEFAULT_LOCALE
+    CHROME_BROWSER, FIREFOX_BROWSER, REMOTE_CHROME_BROWSER, REMOTE_FIREFOX_BROWSER, PLAYWRIGHT_DEFAULT_LOCALE, \
+    DEFAULT_BROWSER_POOL_SIZE, LAUNCH_PROFILES, DEFAULT_BROWSER_PROFILE, DISABLED_DISK_CACHE, CHROMIUM_LEAN_ARGS, \
+    FIREFOX_LEAN_PREFS
+from framework_inject.browser_server import BrowserServer, browser_server
+from framework_inject.logger.logger import Logger
+from framework_inject.network import get_route_layer
+from framework_inject.services.http_session import get_session
+from framework_inject.storage_state import StorageStateStore
+from framework_inject.tracing import new_recorder, close_context, is_recorded
 
 load_dotenv()
 log_level = os.getenv("LOG_LEVEL")
@@ -17,6 +25,11 @@ localization = os.getenv("LOCALIZATION")
 browser = os.getenv("BROWSER")
 save_dir = os.getenv("SAVE_DIR")
 firefox_location = os.getenv("FIREFOX_LOCATION")
+browser_pool_size = int(os.getenv("BROWSER_POOL_SIZE", DEFAULT_BROWSER_POOL_SIZE))
+browser_profile = os.getenv("BROWSER_PROFILE") or DEFAULT_BROWSER_PROFILE
+browser_viewport = os.getenv("BROWSER_VIEWPORT")
+browser_disk_cache = os.getenv("BROWSER_DISK_CACHE")
+storage_state_user = os.getenv("STORAGE_STATE_USER")
 
 
 class DriverWebSocket:
@@ -24,7 +37,7 @@ class DriverWebSocket:
         self.debugger_address = f"{host}/json/version"
 
     def get_websocket_debugger_url(self):
-        response = requests.get(self.debugger_address)
+        response = get_session().get(self.debugger_address)
         if response.status_code == http.HTTPStatus.OK:
             data = response.json()
             web_socket_debugger_url = data.get("webSocketDebuggerUrl")
@@ -37,64 +50,223 @@ class DriverWebSocket:
             print(f"Failed to fetch debugger version. Status code: {response.status_code}")
 
 
-class ChromeBrowser:
-    def __init__(self):
-        self.driver_ws_url = DriverWebSocket().get_websocket_debugger_url()
+def get_launch_profile(profile=browser_profile):
+    """Return the LAUNCH_PROFILES entry selected by BROWSER_PROFILE."""
+    if profile not in LAUNCH_PROFILES:
+        raise Exception(f"No Such Browser Profile: {profile}")
+    return LAUNCH_PROFILES[profile]
+
+
+def get_viewport(profile=browser_profile):
+    """Viewport from BROWSER_VIEWPORT ("1280x1024"), the profile, or DEFAULT_VIEWPORT_SIZE."""
+    if browser_viewport:
+        width, height = browser_viewport.lower().split("x")
+        return {"width": int(width), "height": int(height)}
+    return get_launch_profile(profile).get("viewport", DEFAULT_VIEWPORT_SIZE)
+
+
+def get_launch_options(engine, profile=browser_profile, disk_cache=browser_disk_cache):
+    """
+    Build `launch()` keyword arguments for a Playwright engine ("chromium" or "firefox").
+
+    Args:
+        engine (str): Playwright browser type name.
+        profile (str): One of LAUNCH_PROFILES (BROWSER_PROFILE in .env).
+        disk_cache (str, optional): "off" to disable the disk cache, or a folder shared as disk cache
+            (BROWSER_DISK_CACHE in .env). Browser default when empty.
+
+    Returns:
+        dict: Options for BrowserType.launch().
+    """
+    settings = get_launch_profile(profile)
+    options = {"headless": settings["headless"]}
+    args, prefs = [], {}
+    if engine == "chromium":
+        if settings.get("new_headless"):
+            # Playwright runs the full Chromium build in the new headless mode for this channel
+            options["channel"] = "chromium"
+        if settings.get("lean"):
+            args.extend(CHROMIUM_LEAN_ARGS)
+        if disk_cache == DISABLED_DISK_CACHE:
+            args.extend(["--disk-cache-size=1", "--media-cache-size=1"])
+        elif disk_cache:
+            args.append(f"--disk-cache-dir={os.path.expanduser(disk_cache)}")
+    elif engine == "firefox":
+        if settings.get("lean"):
+            prefs.update(FIREFOX_LEAN_PREFS)
+        if disk_cache == DISABLED_DISK_CACHE:
+            prefs["browser.cache.disk.enable"] = False
+        elif disk_cache:
+            prefs["browser.cache.disk.parent_directory"] = os.path.expanduser(disk_cache)
+    if args:
+        options["args"] = args
+    if prefs:
+        options["firefox_user_prefs"] = prefs
+    return options
+
+
+def new_page_context(browser, locale=PLAYWRIGHT_DEFAULT_LOCALE, storage_state=None):
+    """
+    Create an isolated browser context with a single configured page.
+    Tracing/HAR recording (TRACE_MODE, RECORD_HAR) starts with the context; close it with `close_context`.
+
+    Args:
+        browser: Running Playwright browser.
+        locale (str): Context locale.
+        storage_state (str | dict, optional): Saved storage state to start the context from (already logged in).
+
+    Returns:
+        tuple: (BrowserContext, Page)
+    """
+    recorder = new_recorder()
+    recording_options = recorder.context_options() if recorder else {}
+    context = browser.new_context(locale=locale, viewport=get_viewport(), storage_state=storage_state,
+                                  **recording_options)
+    if recorder:
+        recorder.attach(context)
+    route_layer = get_route_layer()
+    if route_layer:
+        route_layer.attach(context)
+    page = context.new_page()
+    page.set_default_timeout(PLAYWRIGHT_PAGE_DEFAULT_TIMEOUT_MS)
+    return context, page
+
+
+def ensure_storage_state(browser, user, login, env=None, store=None, locale=PLAYWRIGHT_DEFAULT_LOCALE):
+    """
+    Return a fresh saved storage state for `user`, running `login(page)` in a throw-away context
+    when the state is missing or expired.
+
+    Returns:
+        str: Path to pass as `storage_state` to new contexts.
+    """
+    store = store or StorageStateStore()
+    state = store.load(user, env)
+    if state:
+        return state
+    context, page = new_page_context(browser, locale)
+    try:
+        login(page)
+        return store.save(context, user, env)
+    finally:
+        close_context(context)
+
+
+class ChromeBrowser(Logger):
+    def __init__(self, logger=__file__):
+        super().__init__(logger)
         self.playwright = None
         self.browser = None
         self.page = None
 
-    def run_browser(self, locale=PLAYWRIGHT_DEFAULT_LOCALE):
+    @property
+    def driver_ws_url(self):
+        """CDP endpoint, resolved only when a remote browser is requested."""
+        return DriverWebSocket().get_websocket_debugger_url()
+
+    def launch(self):
+        """Start Playwright and launch a local browser without opening any context."""
         self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=False)
-        context = self.browser.new_context(locale=locale)
-        self.page = context.new_page()
-        self.page.set_default_timeout(PLAYWRIGHT_PAGE_DEFAULT_TIMEOUT_MS)
-        self.page.set_viewport_size(DEFAULT_VIEWPORT_SIZE)
-        return self.browser, self.page
+        options = get_launch_options("chromium")
+        self.logger.info(f"Launching chromium with profile '{browser_profile}': {options}")
+        self.browser = self.playwright.chromium.launch(**options)
+        return self.browser
 
-    def run_remote_browser(self):
+    def connect(self):
+        """Start Playwright and connect to the remote browser over CDP."""
         self.playwright = sync_playwright().start()
         self.browser = self.playwright.chromium.connect_over_cdp(self.driver_ws_url)
+        return self.browser
+
+    def run_browser(self, locale=PLAYWRIGHT_DEFAULT_LOCALE, storage_state=None):
+        self.launch()
+        _context, self.page = new_page_context(self.browser, locale, storage_state)
+        return self.browser, self.page
+
+    def run_server_browser(self, locale=PLAYWRIGHT_DEFAULT_LOCALE, storage_state=None):
+        """Connect to the long-lived BrowserServer (starting it if needed) and open a new context on it."""
+        options = get_launch_options("chromium")
+        self.playwright = sync_playwright().start()
+        address = BrowserServer().start(options["headless"], options.get("args", []), self.playwright)
+        self.browser = self.playwright.chromium.connect_over_cdp(address)
+        _context, self.page = new_page_context(self.browser, locale, storage_state)
+        return self.browser, self.page
+
+    def run_remote_browser(self):
+        self.connect()
         context = self.browser.contexts[0]
+        # The default context already exists, so it can be traced but not recorded as HAR
+        recorder = new_recorder(har=False, owns_context=False)
+        if recorder:
+            recorder.attach(context)
         self.page = context.new_page()
         return self.browser, self.page
 
     def close_browser(self):
         if self.page:
-            self.page.close()
+            try:
+                if is_recorded(self.page.context):
+                    close_context(self.page.context)
+                if not self.page.is_closed():
+                    self.page.close()
+            except Exception as e:
+                self.logger.debug("Error closing the browser context: %s", e)
         if self.browser:
             self.browser.close()
         if self.playwright:
             self.playwright.stop()
 
 
-class FireFoxBrowser:
-    def __init__(self):
-        self.driver_ws_url = DriverWebSocket().get_websocket_debugger_url()
+class FireFoxBrowser(Logger):
+    def __init__(self, logger=__file__):
+        super().__init__(logger)
         self.playwright = None
         self.browser = None
         self.page = None
 
-    def run_browser(self, locale=PLAYWRIGHT_DEFAULT_LOCALE):
+    @property
+    def driver_ws_url(self):
+        """CDP endpoint, resolved only when a remote browser is requested."""
+        return DriverWebSocket().get_websocket_debugger_url()
+
+    def launch(self):
+        """Start Playwright and launch a local browser without opening any context."""
         self.playwright = sync_playwright().start()
-        self.browser = self.playwright.firefox.launch(headless=False)
-        context = self.browser.new_context(locale=locale)
-        self.page = context.new_page()
-        self.page.set_default_timeout(PLAYWRIGHT_PAGE_DEFAULT_TIMEOUT_MS)
-        self.page.set_viewport_size(DEFAULT_VIEWPORT_SIZE)
-        return self.browser, self.page
+        options = get_launch_options("firefox")
+        self.logger.info(f"Launching firefox with profile '{browser_profile}': {options}")
+        self.browser = self.playwright.firefox.launch(**options)
+        return self.browser
 
-    def run_remote_browser(self):
+    def connect(self):
+        """Start Playwright and connect to the remote browser over CDP."""
         self.playwright = sync_playwright().start()
         self.browser = self.playwright.chromium.connect_over_cdp(self.driver_ws_url)
+        return self.browser
+
+    def run_browser(self, locale=PLAYWRIGHT_DEFAULT_LOCALE, storage_state=None):
+        self.launch()
+        _context, self.page = new_page_context(self.browser, locale, storage_state)
+        return self.browser, self.page
+
+    def run_remote_browser(self):
+        self.connect()
         context = self.browser.contexts[0]
+        # The default context already exists, so it can be traced but not recorded as HAR
+        recorder = new_recorder(har=False, owns_context=False)
+        if recorder:
+            recorder.attach(context)
         self.page = context.new_page()
         return self.browser, self.page
 
     def close_browser(self):
         if self.page:
-            self.page.close()
+            try:
+                if is_recorded(self.page.context):
+                    close_context(self.page.context)
+                if not self.page.is_closed():
+                    self.page.close()
+            except Exception as e:
+                self.logger.debug("Error closing the browser context: %s", e)
         if self.browser:
             self.browser.close()
         if self.playwright:
@@ -120,32 +292,80 @@ class Singleton(type):
 class BrowserFactory(metaclass=Singleton):
     @staticmethod
     def get_browser(browsertype):
+        _launcher, browser, page = BrowserFactory.get_launcher(browsertype)
+        return browser, page
+
+    @staticmethod
+    def get_launcher(browsertype):
+        """
+        Start the browser like `get_browser` and also return the ChromeBrowser/FireFoxBrowser that owns it,
+        whose `close_browser()` closes the browser and stops the Playwright driver.
+
+        Returns:
+            tuple: (launcher, browser, page), or (None, None, None) for an unknown browser type.
+        """
+        storage_state = StorageStateStore().load(storage_state_user) if storage_state_user else None
         try:
             if browsertype == BROWSERS.index(FIREFOX_BROWSER):
-                browser, page = FireFoxBrowser().run_browser(localization)
-                return browser, page
+                launcher = FireFoxBrowser()
+                browser, page = launcher.run_browser(localization, storage_state)
+                return launcher, browser, page
+            elif browsertype == BROWSERS.index(CHROME_BROWSER) and browser_server:
+                launcher = ChromeBrowser()
+                browser, page = launcher.run_server_browser(localization, storage_state)
+                return launcher, browser, page
             elif browsertype == BROWSERS.index(CHROME_BROWSER):
-                browser, page = ChromeBrowser().run_browser(localization)
-                return browser, page
+                launcher = ChromeBrowser()
+                browser, page = launcher.run_browser(localization, storage_state)
+                return launcher, browser, page
             elif browsertype == BROWSERS.index(REMOTE_FIREFOX_BROWSER):
-                browser, page = FireFoxBrowser().run_remote_browser()
-                return browser, page
+                launcher = FireFoxBrowser()
+                browser, page = launcher.run_remote_browser()
+                return launcher, browser, page
             elif browsertype == BROWSERS.index(REMOTE_CHROME_BROWSER):
-                browser, page = ChromeBrowser().run_remote_browser()
-                return browser, page
+                launcher = ChromeBrowser()
+                browser, page = launcher.run_remote_browser()
+                return launcher, browser, page
             raise AssertionError("Browser not found")
         except AssertionError as _e:
             print(_e)  # todo: change to logger
+            return None, None, None
 
 
-class RunBrowser(metaclass=Singleton):
-    def __init__(self):
+class RunBrowser(Logger, metaclass=Singleton):
+    def __init__(self, logger=__file__):
+        super().__init__(logger)
         if browser in BROWSERS:
+            start = time.perf_counter()
             browser_index = BROWSERS.index(browser)
-            self.browser, self.page = BrowserFactory.get_browser(browser_index)
+            self.launcher, self.browser, self.page = BrowserFactory.get_launcher(browser_index)
+            self.startup_time = time.perf_counter() - start
+            self.logger.info(f"Browser {browser} ready in {self.startup_time:.2f}s")
         else:
             raise Exception("No Such Browser")
 
+    def reset(self, storage_state=None):
+        """
+        Replace the page with one in a fresh context on the same browser.
+        The Playwright driver and the browser (or BrowserServer) stay up, so this costs one new context.
+        Without `storage_state` the saved login of STORAGE_STATE_USER is used, as for the first context.
+        """
+        start = time.perf_counter()
+        old_context = self.page.context
+        if old_context in self.browser.contexts[:1] and browser in (REMOTE_CHROME_BROWSER, REMOTE_FIREFOX_BROWSER):
+            # The default context of a remote browser belongs to the user's session: only stop its recording
+            if is_recorded(old_context):
+                close_context(old_context)
+            self.page.close()
+        else:
+            close_context(old_context)
+        if storage_state is None and storage_state_user:
+            storage_state = StorageStateStore().load(storage_state_user)
+        _context, self.page = new_page_context(self.browser, localization or PLAYWRIGHT_DEFAULT_LOCALE,
+                                               storage_state)
+        self.logger.info(f"Browser context reset in {time.perf_counter() - start:.3f}s")
+        return self.page
+
     def update_page(self, new_page):
         """Method to update the page globally."""
         self.page = new_page
@@ -0,0 +1,151 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+import queue
+from contextlib import contextmanager
+from typing import Optional
+
+from framework_inject.browser import Singleton, ChromeBrowser, FireFoxBrowser, new_page_context, browser, \
+    localization, browser_pool_size
+from framework_inject.constants import BROWSERS, CHROME_BROWSER, FIREFOX_BROWSER, REMOTE_CHROME_BROWSER, \
+    REMOTE_FIREFOX_BROWSER, PLAYWRIGHT_DEFAULT_LOCALE
+from framework_inject.logger.logger import Logger
+from framework_inject.tracing import close_context
+
+
+class PageSlot:
+    """
+    One isolated BrowserContext/Page pair owned by a BrowserPool.
+    A slot whose context could not be reopened has `context` None and is rebuilt by the next `acquire`.
+    """
+
+    def __init__(self, pool, context, page):
+        self.pool = pool
+        self.context = context
+        self.page = page
+
+    def release(self, recycle: bool = True) -> None:
+        """Return the slot to its pool."""
+        self.pool.release(self, recycle=recycle)
+
+
+class BrowserPool(Logger, metaclass=Singleton):
+    """
+    Launches one Playwright browser and keeps `size` warm, isolated context/page slots.
+
+    Playwright's sync API is bound to the thread that started it, so slots must be used from
+    that thread; run several pools in separate processes for CPU parallelism.
+
+    The pool is a process-wide singleton: the arguments of the first `BrowserPool(...)` call apply, later
+    calls return that instance and ignore theirs. Call `close()` first to start a pool with other settings.
+    """
+
+    def __init__(self, size: int = browser_pool_size, browser_type: str = browser,
+                 locale: Optional[str] = localization, logger=__file__):
+        super().__init__(logger)
+        if browser_type not in BROWSERS:
+            raise Exception("No Such Browser")
+        self.size = size
+        self.locale = locale or PLAYWRIGHT_DEFAULT_LOCALE
+        self.launcher = FireFoxBrowser() if browser_type in (FIREFOX_BROWSER, REMOTE_FIREFOX_BROWSER) \
+            else ChromeBrowser()
+        if browser_type in (REMOTE_CHROME_BROWSER, REMOTE_FIREFOX_BROWSER):
+            self.browser = self.launcher.connect()
+        elif browser_type in (CHROME_BROWSER, FIREFOX_BROWSER):
+            self.browser = self.launcher.launch()
+        self._free = queue.LifoQueue()
+        self._busy = set()
+        for _ in range(self.size):
+            self._free.put(self._new_slot())
+        self.logger.debug(f"Browser pool started with {self.size} slots ({browser_type})")
+
+    def _new_slot(self) -> PageSlot:
+        context, page = new_page_context(self.browser, self.locale)
+        return PageSlot(self, context, page)
+
+    def acquire(self, timeout: Optional[float] = None, storage_state=None) -> PageSlot:
+        """
+        Check out a warm slot.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a free slot. By default the call does not wait:
+                the sync API runs on this one thread, so nothing could release a slot while it blocks.
+            storage_state (str | dict, optional): Saved storage state; the slot's blank context is replaced
+                by one started from it, so the page is logged in without any reload.
+
+        Returns:
+            PageSlot: The checked out slot.
+
+        Raises:
+            TimeoutError: Every slot is checked out (and none was released within `timeout`).
+        """
+        try:
+            slot = self._free.get_nowait() if timeout is None else self._free.get(timeout=timeout)
+        except queue.Empty:
+            if timeout is None:
+                raise TimeoutError(f"Browser pool exhausted: all {self.size} slots are checked out")
+            raise TimeoutError(f"No free browser slot within {timeout} seconds")
+        if storage_state or slot.context is None:
+            # Open the new context first: if that fails the untouched slot goes back to the pool
+            try:
+                context, page = new_page_context(self.browser, self.locale, storage_state)
+            except Exception:
+                self._free.put(slot)
+                raise
+            if slot.context is not None:
+                try:
+                    close_context(slot.context)
+                except Exception as e:
+                    self.logger.debug(f"Error closing pooled context: {str(e)}")
+            slot.context, slot.page = context, page
+        self._busy.add(slot)
+        return slot
+
+    def release(self, slot: PageSlot, recycle: bool = True) -> None:
+        """
+        Return a slot to the pool.
+
+        Args:
+            slot (PageSlot): Slot obtained from `acquire`.
+            recycle (bool): Close the used context and put a fresh one back, so the next user
+                does not inherit cookies, storage or open dialogs. Defaults to True.
+        """
+        if slot not in self._busy:
+            return
+        self._busy.discard(slot)
+        if recycle:
+            try:
+                close_context(slot.context)
+            except Exception as e:
+                self.logger.debug(f"Error closing pooled context: {str(e)}")
+            try:
+                slot = self._new_slot()
+            except Exception as e:
+                # Keep the pool at full size: the empty slot gets its context on the next acquire
+                self.logger.warning(f"Could not open a fresh pooled context, it is rebuilt on acquire: {str(e)}")
+                slot = PageSlot(self, None, None)
+        self._free.put(slot)
+
+    @contextmanager
+    def slot(self, timeout: Optional[float] = None, recycle: bool = True, storage_state=None):
+        """Check out a slot for the duration of a `with` block and yield its page."""
+        page_slot = self.acquire(timeout, storage_state=storage_state)
+        try:
+            yield page_slot.page
+        finally:
+            self.release(page_slot, recycle=recycle)
+
+    def close(self) -> None:
+        """Close every slot and the browser, and forget the pool instance."""
+        for page_slot in list(self._busy):
+            self._free.put(page_slot)
+        self._busy.clear()
+        while not self._free.empty():
+            page_slot = self._free.get_nowait()
+            if page_slot.context is None:
+                continue
+            try:
+                close_context(page_slot.context)
+            except Exception as e:
+                self.logger.debug(f"Error closing pooled context: {str(e)}")
+        self.launcher.close_browser()
+        BrowserPool.clear()
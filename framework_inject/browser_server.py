@@ -0,0 +1,124 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+import os
+import subprocess
+import time
+from contextlib import contextmanager
+from typing import Iterable, Optional
+
+import requests
+from dotenv import load_dotenv
+from playwright.sync_api import sync_playwright
+
+from framework_inject.constants import DEFAULT_BROWSER_SERVER_PORT, BROWSER_SERVER_START_TIMEOUT_SEC, \
+    BROWSER_SERVER_PROFILE_DIR
+from framework_inject.logger.logger import Logger
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+load_dotenv()
+browser_server = os.getenv("BROWSER_SERVER", "False").lower() == "true"
+browser_server_port = int(os.getenv("BROWSER_SERVER_PORT", DEFAULT_BROWSER_SERVER_PORT))
+browser_server_executable = os.getenv("BROWSER_SERVER_EXECUTABLE")
+
+
+class BrowserServer(Logger):
+    """
+    Long-lived local Chromium exposing a CDP endpoint.
+
+    The browser runs in its own session, so it survives RunBrowser resets and the Python process itself;
+    later processes (e.g. runner workers) find it on the same port and only pay for a CDP connection
+    and a new context.
+    """
+
+    def __init__(self, port: int = browser_server_port, executable: Optional[str] = browser_server_executable,
+                 logger=__file__):
+        super().__init__(logger)
+        self.port = port
+        self.executable = executable
+        self.process = None
+
+    @property
+    def address(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def is_running(self) -> bool:
+        try:
+            return requests.get(f"{self.address}/json/version", timeout=1).ok
+        except requests.RequestException:
+            return False
+
+    def _executable_path(self, playwright=None) -> str:
+        if self.executable:
+            return self.executable
+        if playwright is not None:
+            return playwright.chromium.executable_path
+        # Only valid when this thread is not running sync Playwright yet
+        with sync_playwright() as own_playwright:
+            return own_playwright.chromium.executable_path
+
+    @contextmanager
+    def _start_lock(self):
+        """Inter-process lock, so workers starting together launch a single server (no-op without fcntl)."""
+        os.makedirs(os.path.dirname(os.path.abspath(BROWSER_SERVER_PROFILE_DIR)), exist_ok=True)
+        with open(os.path.abspath(f"{BROWSER_SERVER_PROFILE_DIR}-{self.port}.lock"), "w") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def start(self, headless: bool = False, args: Iterable[str] = (), playwright=None) -> str:
+        """
+        Start the server unless one is already listening on the port.
+
+        Args:
+            headless (bool): Run Chromium in the new headless mode.
+            args (Iterable[str]): Extra Chromium flags (see get_launch_options).
+            playwright (optional): Running sync Playwright of the caller, used to find the Chromium executable.
+
+        Returns:
+            str: CDP endpoint for `chromium.connect_over_cdp`.
+        """
+        if self.is_running():
+            self.logger.debug(f"Browser server already running at {self.address}")
+            return self.address
+        with self._start_lock():
+            if self.is_running():
+                self.logger.debug(f"Browser server started by another process at {self.address}")
+                return self.address
+            start = time.perf_counter()
+            profile_dir = os.path.abspath(f"{BROWSER_SERVER_PROFILE_DIR}-{self.port}")
+            command = [self._executable_path(playwright), f"--remote-debugging-port={self.port}",
+                       f"--user-data-dir={profile_dir}", "--no-first-run", "--no-default-browser-check", *args]
+            if headless:
+                command.append("--headless=new")
+            self.process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                            start_new_session=True)
+            deadline = start + BROWSER_SERVER_START_TIMEOUT_SEC
+            while not self.is_running():
+                # Our Chromium may exit because another process won the port/profile; wait for that one then
+                if time.perf_counter() > deadline:
+                    raise Exception(f"Browser server did not start on port {self.port}")
+                time.sleep(0.05)
+            if self.process.poll() is not None:
+                self.process = None
+                self.logger.debug(f"Browser server started by another process at {self.address}")
+                return self.address
+        self.logger.info(f"Browser server started at {self.address} in {time.perf_counter() - start:.2f}s")
+        return self.address
+
+    def stop(self) -> None:
+        """Stop the server started by this instance."""
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=BROWSER_SERVER_START_TIMEOUT_SEC)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
@@ -8,6 +8,16 @@ DEFAULT_LOCATOR_TYPE = XPATH_LOCATOR
 
 DEFAULT_BROWSER_DEBUGGER_ADDRESS = "http://127.0.0.1:9222"
 
+DEFAULT_HTTP_POOL_SIZE = 32
+DEFAULT_HTTP_TIMEOUT_SEC = 30
+DEFAULT_HTTP_RETRIES = 3
+DEFAULT_HTTP_BACKOFF_SEC = 0.3
+HTTP_BACKOFF_JITTER_SEC = 0.2
+HTTP_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+DEFAULT_HTTP_CONCURRENCY = 50
+LOG_BODY_LIMIT = 2048
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 CHROME_BROWSER = "ChromeBrowser"
 FIREFOX_BROWSER = "FireFoxBrowser"
 REMOTE_CHROME_BROWSER = "Remote" + CHROME_BROWSER
@@ -19,4 +29,72 @@ PLAYWRIGHT_PAGE_DEFAULT_TIMEOUT_SEC = 20
 PLAYWRIGHT_PAGE_DEFAULT_TIMEOUT_MS = PLAYWRIGHT_PAGE_DEFAULT_TIMEOUT_SEC * SECOND
 PLAYWRIGHT_DEFAULT_LOCALE = "en"
 
+HEADED_PROFILE = "headed"
+HEADLESS_PROFILE = "headless"
+NEW_HEADLESS_PROFILE = "new-headless"
+LEAN_PROFILE = "lean"
+LEAN_VIEWPORT_SIZE = {"width": 1024, "height": 768}
+LAUNCH_PROFILES = {
+    HEADED_PROFILE: {"headless": False},
+    HEADLESS_PROFILE: {"headless": True},
+    NEW_HEADLESS_PROFILE: {"headless": True, "new_headless": True},
+    LEAN_PROFILE: {"headless": True, "lean": True, "viewport": LEAN_VIEWPORT_SIZE},
+}
+DEFAULT_BROWSER_PROFILE = HEADED_PROFILE
+DISABLED_DISK_CACHE = "off"
+CHROMIUM_LEAN_ARGS = ["--disable-gpu", "--disable-extensions", "--disable-component-extensions-with-background-pages",
+                      "--disable-background-networking", "--disable-dev-shm-usage", "--mute-audio", "--no-first-run"]
+FIREFOX_LEAN_PREFS = {"layers.acceleration.disabled": True, "gfx.webrender.software": True,
+                      "extensions.update.enabled": False, "media.autoplay.default": 5, "app.update.enabled": False}
+DEFAULT_BROWSER_POOL_SIZE = 8
+DEFAULT_BROWSER_SERVER_PORT = 9333
+BROWSER_SERVER_START_TIMEOUT_SEC = 30
+BROWSER_SERVER_PROFILE_DIR = "logs/.browser-server"
+
+DEFAULT_STORAGE_STATE_DIR = ".auth"
+DEFAULT_STORAGE_STATE_TTL_SEC = 60 * 60
+DEFAULT_STORAGE_STATE_ENV = "default"
+
+DEFAULT_CACHED_RESOURCE_TYPES = ["stylesheet", "script", "image", "font"]
+DEFAULT_RESPONSE_CACHE_TTL_SEC = 24 * 60 * 60
+DEFAULT_RESPONSE_CACHE_MAX_MB = 512
+# Share of max_bytes a process may write before it re-reads the cache folder size written by all processes
+RESPONSE_CACHE_RESYNC_SHARE = 0.1
+
 LOG_TIME_STRUCTURE = "-%Y-%m-%d-%H%M-%S"
+TEXT_LOG_FORMAT = "text"
+JSON_LOG_FORMAT = "json"
+DEFAULT_LOG_BACKUP_COUNT = 10
+
+DEFAULT_DB_POOL_SIZE = 8
+DB_POOL_TIMEOUT_SEC = 30
+DEFAULT_DB_BATCH_SIZE = 1000
+DEFAULT_DB_FETCH_SIZE = 1000
+DB_LOG_SAMPLE_ROWS = 3
+DEFAULT_DB_CONCURRENCY = 4
+DEFAULT_QUERY_CACHE_SIZE = 512
+DEFAULT_QUERY_CACHE_TTL_SEC = 300
+
+RUNNER_REPORT_DIR = "logs/reports"
+STEP_TARGET_LIMIT = 120
+STEP_PERCENTILES = (50, 95, 99)
+
+PIXEL_DIFF = "pixel"
+SSIM_DIFF = "ssim"
+PHASH_DIFF = "phash"
+IMAGE_DIFF_MODES = (PIXEL_DIFF, SSIM_DIFF, PHASH_DIFF)
+IMAGE_DIFF_THRESHOLDS = {PIXEL_DIFF: 0.1, SSIM_DIFF: 1.0, PHASH_DIFF: 5}
+IMAGE_DIFF_FAILED = 99999
+
+CDP_PERFORMANCE_METRICS = ("JSHeapUsedSize", "JSHeapTotalSize", "Nodes", "LayoutCount", "RecalcStyleCount",
+                           "LayoutDuration", "RecalcStyleDuration", "ScriptDuration", "TaskDuration")
+# Cumulative over the life of a page; recorded as the difference from the previous goto on the same page
+CDP_PERFORMANCE_COUNTERS = ("LayoutCount", "RecalcStyleCount", "LayoutDuration", "RecalcStyleDuration",
+                            "ScriptDuration", "TaskDuration")
+
+TRACE_OFF = "off"
+TRACE_ON = "on"
+TRACE_RETAIN_ON_FAILURE = "retain-on-failure"
+TRACE_MODES = (TRACE_OFF, TRACE_ON, TRACE_RETAIN_ON_FAILURE)
+TRACE_DIR = "logs/traces"
+DEFAULT_TRACE_RING_SIZE = 20
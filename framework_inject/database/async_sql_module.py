@@ -0,0 +1,75 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import dotenv
+
+from framework_inject.constants import DEFAULT_DB_BATCH_SIZE, DEFAULT_DB_CONCURRENCY
+from framework_inject.database.sql_module import Database, db_host, db_user, db_password, db_name, db_port
+from framework_inject.logger.logger import Logger
+from framework_inject.services.sql_service import SQL, new_connection_pool
+
+dotenv.load_dotenv()
+db_concurrency = int(os.getenv("DB_CONCURRENCY", DEFAULT_DB_CONCURRENCY))
+
+
+class AsyncDatabase(Logger):
+    """
+    asyncio counterpart of Database, so DB checks can overlap with async browser and API work.
+
+    Every call runs the blocking Database method on a dedicated thread pool with its own connection pool
+    of `concurrency` connections (not shared with the sync Database). At most `concurrency` queries
+    are in flight at once; further calls wait on the semaphore without blocking the event loop.
+    """
+
+    def __init__(self, concurrency: int = db_concurrency, logger=__file__):
+        super().__init__(logger)
+        self.concurrency = concurrency
+        self.pool = new_connection_pool(db_host, db_user, db_password, db_name, db_port, concurrency)
+        sql_connection = SQL(db_host, db_user, db_password, db_name, db_port, dictionary=True, pool=self.pool)
+        self.database = Database(sql_connection=sql_connection)
+        self.executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="async-db")
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _run(self, func, *args, **kwargs):
+        # run_in_executor does not carry contextvars; copy them so the log context and current step reach the thread
+        context = contextvars.copy_context()
+        async with self.semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, context.run, functools.partial(func, *args, **kwargs))
+
+    async def get_db_data(self, query, args=None, dictionary=None, cache=False, cache_ttl=None):
+        return await self._run(self.database.get_db_data, query, args=args, dictionary=dictionary,
+                               cache=cache, cache_ttl=cache_ttl)
+
+    async def update_db_data(self, query, args=None):
+        return await self._run(self.database.update_db_data, query, args=args)
+
+    async def bulk_update_db_data(self, query, rows, batch_size=DEFAULT_DB_BATCH_SIZE, commit_per_batch=False):
+        return await self._run(self.database.bulk_update_db_data, query, rows, batch_size=batch_size,
+                               commit_per_batch=commit_per_batch)
+
+    async def get_named_data(self, name, args=None):
+        return await self._run(self.database.get_named_data, name, args=args)
+
+    async def update_named_data(self, name, args=None):
+        return await self._run(self.database.update_named_data, name, args=args)
+
+    async def close(self) -> None:
+        """Wait for running queries, then close the thread pool and every connection of the pool."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, functools.partial(self.executor.shutdown, wait=True))
+        if self.database._queries is not None:
+            self.database.queries.close()
+        self.database.sql_connection.close_connect()
+        self.pool.close_all()
@@ -0,0 +1,111 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set
+
+from framework_inject.constants import DEFAULT_QUERY_CACHE_SIZE, DEFAULT_QUERY_CACHE_TTL_SEC
+
+_MISS = object()
+_NAME = r"(?:`[^`]+`|[\w$]+)(?:\s*\.\s*(?:`[^`]+`|[\w$]+))?"
+# Optional alias, which must not be the keyword that ends the table reference
+_ALIAS = r"(?:\s+(?:as\s+)?(?!(?:where|join|inner|left|right|cross|natural|straight_join|on|using|set|group|order|" \
+         r"limit|having|union|values|value|select|for|lock|window|partition|into|ignore|force|use)\b)[\w$]+)?"
+_TABLE_PATTERN = re.compile(rf"\b(?:from|join|into|update|table)\s+({_NAME}{_ALIAS}(?:\s*,\s*{_NAME}{_ALIAS})*)",
+                            re.IGNORECASE)
+# Derived tables hide what follows them (`FROM (SELECT ...) s, b`) from the pattern above
+_DERIVED_TABLE_PATTERN = re.compile(r"\b(?:from|join)\s*\(", re.IGNORECASE)
+
+
+def normalize_sql(query: str) -> str:
+    """Collapse whitespace and drop the trailing semicolon, so formatting does not split cache entries."""
+    return " ".join(query.split()).rstrip(";").strip()
+
+
+def tables_in(query: str) -> Optional[Set[str]]:
+    """
+    Lower-case table names (without schema) referenced after FROM/JOIN/INTO/UPDATE/TABLE,
+    including comma-separated lists such as `FROM a, b AS x`.
+    None when the tables cannot be told reliably (derived tables, no table found); callers then
+    treat the query as touching every table.
+    """
+    if _DERIVED_TABLE_PATTERN.search(query):
+        return None
+    tables = set()
+    for match in _TABLE_PATTERN.finditer(query):
+        for reference in match.group(1).split(","):
+            name = re.match(_NAME, reference.strip()).group(0)
+            tables.add(name.split(".")[-1].strip().strip("`").lower())
+    return tables or None
+
+
+class QueryCache:
+    """
+    LRU cache of read query results with per-entry TTL.
+
+    Entries remember the tables their query reads, so a write touching one of those tables
+    drops them (see `invalidate_tables`); entries whose tables could not be parsed are dropped by any write. Hit/miss counters are exposed through `stats()`.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_QUERY_CACHE_SIZE, ttl: float = DEFAULT_QUERY_CACHE_TTL_SEC):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(query: str, args=None, dictionary=None, source: Hashable = None) -> Hashable:
+        """
+        Cache key of a read. `source` identifies the server and schema the query runs on (see
+        Database), so databases sharing the process-wide cache never get each other's rows.
+        """
+        return normalize_sql(query), repr(args), dictionary, source
+
+    def get(self, key: Hashable, default=None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, tables_in(key[0]), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_tables(self, tables: Optional[Iterable[str]]) -> int:
+        """
+        Drop every entry reading one of `tables`; returns the number of dropped entries.
+        With `tables` None or empty (the write could not be parsed) every entry is dropped.
+        """
+        tables = {table.lower() for table in tables or ()}
+        with self._lock:
+            stale = [key for key, entry in self._entries.items()
+                     if not tables or entry[1] is None or entry[1] & tables]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0}
+
+
+query_cache = QueryCache()
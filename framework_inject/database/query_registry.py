@@ -0,0 +1,144 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+import os
+import threading
+import time
+from types import ModuleType
+from typing import Any, Dict, List, Mapping, Optional
+
+import dotenv
+import mysql.connector
+from mysql.connector import errorcode
+
+from framework_inject.database import sql_queries
+from framework_inject.logger.logger import Logger
+from framework_inject.step_timing import add_retries
+
+dotenv.load_dotenv()
+db_prefix = os.getenv("DB_PREFIX", "")
+
+
+class QueryRegistry(Logger):
+    """
+    Named queries from `sql_queries.py`, rendered once per environment and executed as server-side
+    prepared statements.
+
+    Every call borrows a connection from the SQL pool and returns it afterwards. Prepared cursors are kept
+    per connection and query name, so each query is parsed by the server once per pooled connection and later
+    calls only send the parameters. The transaction is committed after every call, so reads always see rows
+    committed through other connections.
+    Parameters are positional (`%s`), so `args` is a sequence; mappings are rejected with TypeError.
+    Call `close()` (with no call running) to deallocate the prepared statements.
+    """
+
+    def __init__(self, sql, module: ModuleType = sql_queries, prefix: str = db_prefix, dictionary=None,
+                 logger=__file__):
+        super().__init__(logger)
+        self.sql = sql
+        self.dictionary = sql.dictionary if dictionary is None else dictionary
+        self.queries = {name: value.format(db_prefix=prefix).strip().rstrip(";")
+                        for name, value in vars(module).items() if name.isupper() and isinstance(value, str)}
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self._cursors: Dict[int, tuple] = {}
+        self._lock = threading.Lock()
+
+    def render(self, name: str) -> str:
+        """SQL text of a named query with the environment prefix applied."""
+        if name not in self.queries:
+            raise KeyError(f"'{name}' not found in query registry")
+        return self.queries[name]
+
+    def _cursor(self, connection, name: str):
+        # A connection is used by one thread at a time, so its cursors need no lock of their own
+        with self._lock:
+            _connection, cursors = self._cursors.setdefault(id(connection), (connection, {}))
+        cursor = cursors.get(name)
+        if cursor is None:
+            cursor = connection.cursor(prepared=True, dictionary=self.dictionary)
+            cursors[name] = cursor
+        return cursor
+
+    def _forget(self, connection, name: Optional[str] = None) -> None:
+        """Close and drop the prepared cursor `name` (all of them if None) of a connection."""
+        with self._lock:
+            entry = self._cursors.get(id(connection))
+            if entry is None:
+                return
+            if name is None:
+                del self._cursors[id(connection)]
+                cursors = list(entry[1].values())
+            else:
+                cursors = [entry[1].pop(name)] if name in entry[1] else []
+        for cursor in cursors:
+            try:
+                cursor.close()
+            except mysql.connector.Error:
+                pass
+
+    def _record(self, name: str, elapsed: float) -> None:
+        with self._lock:
+            stats = self.timings.setdefault(name, {"calls": 0, "total": 0.0, "max": 0.0})
+            stats["calls"] += 1
+            stats["total"] += elapsed
+            stats["max"] = max(stats["max"], elapsed)
+
+    def _execute(self, name: str, args, fetch: bool, retry: bool = True):
+        query = self.render(name)
+        if isinstance(args, Mapping):
+            raise TypeError(f"Named query '{name}' takes positional args (a sequence), not a mapping")
+        start = time.perf_counter()
+        connection = self.sql.pool.get_connection()
+        lost = False
+        # The connection goes back to the pool whatever is raised, only a lost one is dropped
+        try:
+            cursor = self._cursor(connection, name)
+            cursor.execute(query, args or ())
+            result = cursor.fetchall() if fetch else cursor.lastrowid
+            # Also ends read transactions, so the next REPEATABLE READ snapshot is taken fresh
+            connection.commit()
+        except mysql.connector.Error as err:
+            lost = isinstance(err, (mysql.connector.errors.OperationalError, mysql.connector.errors.InterfaceError))
+            # After a reconnect the server no longer knows the statements prepared on this connection
+            unknown_statement = err.errno == errorcode.ER_UNKNOWN_STMT_HANDLER
+            self._forget(connection, None if lost or unknown_statement else name)
+            if not retry or not (lost or unknown_statement):
+                raise
+            self.logger.warning(f"Connection lost while running '{name}': {err}. Retrying on a new connection")
+            add_retries()
+        else:
+            self._record(name, time.perf_counter() - start)
+            return result
+        finally:
+            if lost:
+                self.sql.pool.discard(connection)
+            else:
+                self.sql.pool.put_connection(connection)
+        return self._execute(name, args, fetch, retry=False)
+
+    def run(self, name: str, args=None) -> Optional[List[Any]]:
+        """Execute a named read query and return all rows (None on error)."""
+        try:
+            return self._execute(name, args, fetch=True)
+        except mysql.connector.Error as err:
+            self.logger.error(f"Error executing query '{name}': {err}")
+            return None
+
+    def update(self, name: str, args=None) -> Optional[int]:
+        """Execute and commit a named write query and return lastrowid (None on error, rolled back)."""
+        try:
+            return self._execute(name, args, fetch=False)
+        except mysql.connector.Error as err:
+            self.logger.error(f"Error executing update query '{name}': {err}")
+            return None
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Calls, total and max seconds plus average per named query."""
+        with self._lock:
+            return {name: {**stats, "avg": stats["total"] / stats["calls"]} for name, stats in self.timings.items()}
+
+    def close(self) -> None:
+        """Deallocate the prepared statements on every pooled connection."""
+        with self._lock:
+            connections = [entry[0] for entry in self._cursors.values()]
+        for connection in connections:
+            self._forget(connection)
@@ -5,8 +5,12 @@ import os
 
 import dotenv
 
+from framework_inject.constants import DEFAULT_DB_BATCH_SIZE, DB_LOG_SAMPLE_ROWS
+from framework_inject.database.query_cache import query_cache, tables_in
+from framework_inject.database.query_registry import QueryRegistry
 from framework_inject.logger.logger import Logger
 from framework_inject.services.sql_service import SQL
+from framework_inject.step_timing import timed
 
 dotenv.load_dotenv()
 
@@ -18,15 +22,96 @@ db_port = os.getenv("DB_PORT")
 
 
 class Database(Logger):
-    def __init__(self, logger=__file__):
+    def __init__(self, logger=__file__, *, sql_connection=None):
         super().__init__(logger)
-        self.sql_connection = SQL(db_host, db_user, db_password, db_name, db_port, dictionary=True)
+        self.sql_connection = sql_connection or SQL(db_host, db_user, db_password, db_name, db_port, dictionary=True)
+        self.query_cache = query_cache
+        settings = self.sql_connection.pool.connect_kwargs
+        self._cache_source = tuple(settings.get(name) for name in ("host", "port", "database", "user"))
+        self._queries = None
 
-    def get_db_data(self, query, args=None, dictionary=None):
+    @property
+    def queries(self) -> QueryRegistry:
+        """Named queries from sql_queries.py, executed as prepared statements."""
+        if self._queries is None:
+            self._queries = QueryRegistry(self.sql_connection)
+        return self._queries
+
+    @timed(target="name")
+    def get_named_data(self, name, args=None):
+        """Run the read query `name` from sql_queries.py as a prepared statement and return all rows."""
+        query_result = self.queries.run(name, args)
+        if query_result is not None:
+            self.logger.debug(f"GET DB JSON RESULT FOR {name}: {len(query_result)} rows, "
+                              f"sample: \n {query_result[:DB_LOG_SAMPLE_ROWS]}")
+        return query_result
+
+    @timed(target="name")
+    def update_named_data(self, name, args=None):
+        """Run and commit the write query `name` from sql_queries.py as a prepared statement."""
+        query_result = self.queries.update(name, args)
+        self._invalidate_cache(self.queries.render(name))
+        return query_result
+
+    def query_timings(self):
+        """Calls, total/max/avg seconds per named query run through `queries`."""
+        return self.queries.stats()
+
+    @timed(target="query")
+    def get_db_data(self, query, args=None, dictionary=None, cache=False, cache_ttl=None):
+        """
+        Run a read query and return all rows.
+
+        Args:
+            cache (bool): Serve repeated identical reads (normalized SQL + args) from the process-wide
+                query cache. Entries are dropped when update_db_data/bulk_update_db_data write to a table
+                the query reads; writes made outside Database are not seen.
+            cache_ttl (float, optional): Seconds to keep this result; implies `cache`.
+                Defaults to DEFAULT_QUERY_CACHE_TTL_SEC.
+        """
+        use_cache = cache or cache_ttl is not None
+        if use_cache:
+            key = self.query_cache.key(query, args, dictionary, self._cache_source)
+            cached = self.query_cache.get(key)
+            if cached is not None:
+                self.logger.debug(f"GET DB JSON RESULT FROM CACHE: {len(cached)} rows")
+                return [dict(row) if isinstance(row, dict) else row for row in cached]
         query_result = self.sql_connection.run_script(query, args=args, dictionary=dictionary)
-        self.logger.debug(f"GET DB JSON RESULT FOR ENTRY: \n {query_result}")
+        if query_result is not None:
+            self.logger.debug(f"GET DB JSON RESULT FOR ENTRY: {len(query_result)} rows, "
+                              f"sample: \n {query_result[:DB_LOG_SAMPLE_ROWS]}")
+            if use_cache:
+                self.query_cache.put(key, query_result, cache_ttl)
+                query_result = [dict(row) if isinstance(row, dict) else row for row in query_result]
         return query_result
 
+    def query_cache_stats(self):
+        """Hit/miss counters, size and hit rate of the query cache."""
+        return self.query_cache.stats()
+
+    def _invalidate_cache(self, query):
+        dropped = self.query_cache.invalidate_tables(tables_in(query))
+        if dropped:
+            self.logger.debug(f"Dropped {dropped} cached queries")
+
+    def iter_db_data(self, query, args=None, dictionary=None, chunk_size=None):
+        """
+        Lazily iterate a (large) SELECT result on an unbuffered cursor: rows one by one,
+        or lists of `chunk_size` rows. Close the iterator (or exhaust it) to release the connection.
+        """
+        self.logger.debug("STREAM DB RESULT FOR ENTRY")
+        return self.sql_connection.iter_script(query, args=args, dictionary=dictionary, chunk_size=chunk_size)
+
+    @timed(target="query")
     def update_db_data(self, query, args=None):
         query_result = self.sql_connection.update_data(query, args=args)
+        self._invalidate_cache(query)
+        return query_result
+
+    @timed(target="query")
+    def bulk_update_db_data(self, query, rows, batch_size=DEFAULT_DB_BATCH_SIZE, commit_per_batch=False):
+        """Run `query` for every parameter tuple in `rows` in batches; returns BulkResult or None."""
+        query_result = self.sql_connection.bulk_update(query, rows, batch_size=batch_size,
+                                                       commit_per_batch=commit_per_batch)
+        self._invalidate_cache(query)
         return query_result
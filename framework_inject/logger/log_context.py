@@ -0,0 +1,82 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+import gzip
+import json
+import logging
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict
+
+CONTEXT_FIELDS = ("scenario", "worker", "page", "step")
+
+_log_context: ContextVar[Dict[str, Any]] = ContextVar("log_context", default={})
+
+
+def get_log_context() -> Dict[str, Any]:
+    return _log_context.get()
+
+
+def set_log_context(**fields):
+    """Add fields to the log context of the current thread/task; returns a token for `_log_context.reset`."""
+    return _log_context.set({**_log_context.get(), **fields})
+
+
+@contextmanager
+def log_context(**fields):
+    """Log records inside the block carry `fields` (e.g. scenario, page, step); restored on exit."""
+    token = set_log_context(**fields)
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """
+    Copies scenario/worker/page/step from the log context onto every record. Attach it to the logger,
+    not to a handler, so it runs on the calling thread even in LOG_QUEUE mode.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _log_context.get()
+        for name in CONTEXT_FIELDS:
+            if not hasattr(record, name):
+                setattr(record, name, context.get(name))
+        if record.worker is None:
+            record.worker = os.getenv("LOG_WORKER")
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, message, process and the context fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)) + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "pid": record.process,
+            "thread": record.threadName,
+        }
+        for name in CONTEXT_FIELDS:
+            value = getattr(record, name, None)
+            if value is not None:
+                entry[name] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def gzip_rotator(source: str, dest: str) -> None:
+    """Compress a rotated log file into `dest` and remove the original."""
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
@@ -1,16 +1,60 @@
 """Framework: https://github.com/eshut/Inject-Framework"""
 
+import atexit
+import copy
 import logging
+import queue
 from logging import LogRecord
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
 import os
 import time
 import sys
 from dotenv import load_dotenv
 
-from framework_inject.constants import LOG_TIME_STRUCTURE
+from framework_inject.constants import LOG_TIME_STRUCTURE, TEXT_LOG_FORMAT, JSON_LOG_FORMAT, DEFAULT_LOG_BACKUP_COUNT
+from framework_inject.logger.log_context import ContextFilter, JsonFormatter, gzip_namer, gzip_rotator
 
 load_dotenv()
 log_level = os.getenv("LOG_LEVEL")
+log_queue = os.getenv("LOG_QUEUE", "False").lower() == "true"
+log_format = os.getenv("LOG_FORMAT", TEXT_LOG_FORMAT).lower()
+log_rotate_mb = float(os.getenv("LOG_ROTATE_MB", 0))
+log_rotate_when = os.getenv("LOG_ROTATE_WHEN", "")
+log_backup_count = int(os.getenv("LOG_BACKUP_COUNT", DEFAULT_LOG_BACKUP_COUNT))
+_exit_handler_registered = False
+
+
+def _file_handler(log_file):
+    """Plain, size-rotated (LOG_ROTATE_MB) or time-rotated (LOG_ROTATE_WHEN, e.g. "H", "midnight") file handler;
+    rotated files are gzipped."""
+    if log_rotate_mb > 0:
+        handler = RotatingFileHandler(log_file, maxBytes=int(log_rotate_mb * 1024 * 1024),
+                                      backupCount=log_backup_count, encoding="utf-8")
+    elif log_rotate_when:
+        handler = TimedRotatingFileHandler(log_file, when=log_rotate_when, backupCount=log_backup_count,
+                                           encoding="utf-8")
+    else:
+        return logging.FileHandler(log_file, encoding="utf-8")
+    handler.namer = gzip_namer
+    handler.rotator = gzip_rotator
+    return handler
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues the record as it is: the message and exception text are formatted by the
+    listener's handlers on their thread, not by the caller.
+    Log arguments are therefore rendered a moment later; pass values, not objects that are about to change.
+    """
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        return copy.copy(record)
+
+
+def _stop_queue_listener():
+    if SingletonLogger._instance is not None:
+        SingletonLogger._instance.stop_listener()
+
 
 class SingletonLogger:
     _instance = None
@@ -24,30 +68,71 @@ class SingletonLogger:
     def _initialize(self):
         self.log_level = log_level
         self.logger = logging.getLogger("UnifiedLogger")
-        self.logger.setLevel(logging.DEBUG)
+        self.handlers = []
+        self.listener = None
 
         if not os.path.exists("logs"):
             os.mkdir("logs")
 
         log_time = time.strftime(LOG_TIME_STRUCTURE, time.localtime(time.time()))
-        log_file = os.path.join("logs", f"log-{log_time}.log")
+        log_worker = os.getenv("LOG_WORKER")
+        log_name = f"log-{log_time}-{os.getpid()}"
+        if log_worker:
+            log_name += f"-{log_worker}"
+        log_extension = "jsonl" if log_format == JSON_LOG_FORMAT else "log"
+        log_file = os.path.join("logs", f"{log_name}.{log_extension}")
 
         if not self.logger.handlers:
-            fh = logging.FileHandler(log_file, encoding="utf-8")
+            fh = _file_handler(log_file)
             fh.setLevel(self.log_level)
 
             ch = logging.StreamHandler()
             ch.setLevel(self.log_level)
 
             formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            fh.setFormatter(formatter)
+            fh.setFormatter(JsonFormatter() if log_format == JSON_LOG_FORMAT else formatter)
             ch.setFormatter(formatter)
 
-            self.logger.addHandler(fh)
-            self.logger.addHandler(ch)
+            self.handlers = [fh, ch]
+            if not any(isinstance(log_filter, ContextFilter) for log_filter in self.logger.filters):
+                self.logger.addFilter(ContextFilter())
+            # Records below every handler's level are dropped by the logger before any formatting happens
+            self.logger.setLevel(min(handler.level for handler in self.handlers))
+            if log_queue:
+                # File and console I/O happen on the listener thread, callers only enqueue the record
+                records = queue.SimpleQueue()
+                self.listener = QueueListener(records, *self.handlers, respect_handler_level=True)
+                self.listener.start()
+                self.logger.addHandler(DeferredQueueHandler(records))
+                global _exit_handler_registered
+                if not _exit_handler_registered:
+                    # Once per process; it stops the listener of whichever instance is current at exit
+                    _exit_handler_registered = True
+                    atexit.register(_stop_queue_listener)
+            else:
+                for handler in self.handlers:
+                    self.logger.addHandler(handler)
 
         sys.excepthook = self.handle_exception
 
+    def stop_listener(self):
+        """Write out the queued records and stop the background writer (LOG_QUEUE mode)."""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+    @classmethod
+    def reset(cls):
+        """Close the handlers and drop the instance so the next logger opens a new log file."""
+        if cls._instance is not None:
+            cls._instance.stop_listener()
+            for handler in list(cls._instance.logger.handlers):
+                cls._instance.logger.removeHandler(handler)
+                handler.close()
+            for handler in cls._instance.handlers:
+                handler.close()
+            cls._instance = None
+
     def get_logger(self, name):
         """Return the logger instance with the given name."""
         return logging.getLogger(name)
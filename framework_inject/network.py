@@ -0,0 +1,240 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from dotenv import load_dotenv
+
+from framework_inject.constants import DEFAULT_CACHED_RESOURCE_TYPES, DEFAULT_RESPONSE_CACHE_TTL_SEC, \
+    DEFAULT_RESPONSE_CACHE_MAX_MB, RESPONSE_CACHE_RESYNC_SHARE
+from framework_inject.logger.logger import Logger
+
+load_dotenv()
+block_resource_types = os.getenv("BLOCK_RESOURCE_TYPES", "")
+block_url_patterns = os.getenv("BLOCK_URL_PATTERNS", "")
+response_cache_dir = os.getenv("RESPONSE_CACHE_DIR", "")
+response_cache_ttl = float(os.getenv("RESPONSE_CACHE_TTL_SEC", DEFAULT_RESPONSE_CACHE_TTL_SEC))
+response_cache_max_mb = float(os.getenv("RESPONSE_CACHE_MAX_MB", DEFAULT_RESPONSE_CACHE_MAX_MB))
+response_cache_types = os.getenv("RESPONSE_CACHE_TYPES", ",".join(DEFAULT_CACHED_RESOURCE_TYPES))
+
+# Dropped on replay: the cached body is stored already decoded and with its real length
+HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def _split(value: str) -> list:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+class ResponseCache(Logger):
+    """
+    On-disk HTTP response cache shared across runs and processes.
+
+    Entries are keyed by method + URL + body hash, expire after `ttl` seconds and the least recently used
+    entries are evicted once the cache grows over `max_bytes`. Other processes write to the same folder, so
+    the size is re-read from disk before evicting and after every RESPONSE_CACHE_RESYNC_SHARE of `max_bytes`
+    written here; with N writers the folder can exceed the bound by about N times that share.
+    """
+
+    def __init__(self, folder: str, ttl: float = DEFAULT_RESPONSE_CACHE_TTL_SEC,
+                 max_bytes: int = int(DEFAULT_RESPONSE_CACHE_MAX_MB * 1024 * 1024), logger=__file__):
+        super().__init__(logger)
+        self.folder = os.path.expanduser(folder)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.folder, exist_ok=True)
+        self.size = 0
+        self._written = 0
+        self._sync_size()
+
+    def _sync_size(self) -> None:
+        """Re-read the size of the folder, including what other processes have written."""
+        size = 0
+        for name in os.listdir(self.folder):
+            try:
+                size += os.path.getsize(os.path.join(self.folder, name))
+            except OSError:
+                pass
+        self.size = size
+        self._written = 0
+
+    @staticmethod
+    def key(method: str, url: str, body: Optional[bytes] = None) -> str:
+        body_hash = hashlib.sha256(body or b"").hexdigest()
+        return hashlib.sha256(f"{method.upper()} {url} {body_hash}".encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str):
+        return os.path.join(self.folder, f"{key}.json"), os.path.join(self.folder, f"{key}.body")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return {"status", "headers", "body"} for a fresh entry, None otherwise."""
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if time.time() - meta["stored_at"] > self.ttl:
+                with self._lock:
+                    self._remove(key)
+                return None
+            with open(body_path, "rb") as f:
+                body = f.read()
+            os.utime(meta_path)
+            return {"status": meta["status"], "headers": meta["headers"], "body": body}
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key: str, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        meta_path, body_path = self._paths(key)
+        headers = {name: value for name, value in headers.items() if name.lower() not in HOP_HEADERS}
+        meta = json.dumps({"url": url, "status": status, "headers": headers, "stored_at": time.time()})
+        with self._lock:
+            self._remove(key)
+            for path, data, mode in ((body_path, body, "wb"), (meta_path, meta.encode("utf-8"), "wb")):
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, mode) as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            self.size += len(body) + len(meta)
+            self._written += len(body) + len(meta)
+            if self.size > self.max_bytes or self._written > self.max_bytes * RESPONSE_CACHE_RESYNC_SHARE:
+                self._evict()
+
+    def _remove(self, key: str) -> None:
+        for path in self._paths(key):
+            try:
+                self.size -= os.path.getsize(path)
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache is at 90% of its bound."""
+        self._sync_size()
+        if self.size <= self.max_bytes:
+            return
+        metas = []
+        for name in os.listdir(self.folder):
+            if name.endswith(".json"):
+                try:
+                    metas.append((os.path.getmtime(os.path.join(self.folder, name)), name[:-len(".json")]))
+                except OSError:
+                    pass
+        for _mtime, key in sorted(metas):
+            if self.size <= self.max_bytes * 0.9:
+                break
+            self._remove(key)
+        self.logger.debug(f"Response cache evicted down to {self.size} bytes")
+
+
+class RouteLayer(Logger):
+    """
+    Route handler for a BrowserContext: blocks resources by type or URL glob and replays cacheable
+    GET responses from a ResponseCache.
+
+    Note that Playwright disables the browser's own HTTP cache once a route is installed.
+    """
+
+    def __init__(self, blocked_types: Iterable[str] = (), blocked_patterns: Iterable[str] = (),
+                 cache: Optional[ResponseCache] = None, cached_types: Iterable[str] = DEFAULT_CACHED_RESOURCE_TYPES,
+                 logger=__file__):
+        super().__init__(logger)
+        self.blocked_types = set(blocked_types)
+        self.blocked_patterns = list(blocked_patterns)
+        self.cache = cache
+        self.cached_types = set(cached_types)
+        self.stats = {"blocked": 0, "cache_hits": 0, "cache_misses": 0}
+
+    def is_blocked(self, request) -> bool:
+        return request.resource_type in self.blocked_types or \
+            any(fnmatch.fnmatch(request.url, pattern) for pattern in self.blocked_patterns)
+
+    def _cache_key(self, request) -> Optional[str]:
+        if self.cache is None or request.method != "GET" or request.resource_type not in self.cached_types:
+            return None
+        return self.cache.key(request.method, request.url, request.post_data_buffer)
+
+    def _store(self, key: str, request, response, body: bytes) -> None:
+        if response.status == 200 and "no-store" not in response.headers.get("cache-control", ""):
+            self.cache.put(key, request.url, response.status, response.headers, body)
+
+    def attach(self, context) -> None:
+        """Install the route on a sync BrowserContext."""
+        context.route("**/*", self.handle)
+
+    def handle(self, route, request) -> None:
+        if self.is_blocked(request):
+            self.stats["blocked"] += 1
+            route.abort("blockedbyclient")
+            return
+        key = self._cache_key(request)
+        if key is None:
+            route.continue_()
+            return
+        entry = self.cache.get(key)
+        if entry:
+            self.stats["cache_hits"] += 1
+            route.fulfill(status=entry["status"], headers=entry["headers"], body=entry["body"])
+            return
+        self.stats["cache_misses"] += 1
+        try:
+            response = route.fetch()
+            body = response.body()
+        except Exception as e:
+            # Let the browser send the request itself, so it fails (or succeeds) as it would without the route
+            self.logger.debug(f"Could not fetch {request.url} for the response cache: {e}")
+            route.continue_()
+            return
+        self._store(key, request, response, body)
+        route.fulfill(response=response, body=body)
+
+    async def attach_async(self, context) -> None:
+        """Install the route on an async BrowserContext."""
+        await context.route("**/*", self.handle_async)
+
+    async def handle_async(self, route, request) -> None:
+        if self.is_blocked(request):
+            self.stats["blocked"] += 1
+            await route.abort("blockedbyclient")
+            return
+        key = self._cache_key(request)
+        if key is None:
+            await route.continue_()
+            return
+        entry = self.cache.get(key)
+        if entry:
+            self.stats["cache_hits"] += 1
+            await route.fulfill(status=entry["status"], headers=entry["headers"], body=entry["body"])
+            return
+        self.stats["cache_misses"] += 1
+        try:
+            response = await route.fetch()
+            body = await response.body()
+        except Exception as e:
+            self.logger.debug(f"Could not fetch {request.url} for the response cache: {e}")
+            await route.continue_()
+            return
+        self._store(key, request, response, body)
+        await route.fulfill(response=response, body=body)
+
+
+_route_layer = None
+
+
+def get_route_layer() -> Optional[RouteLayer]:
+    """
+    Process-wide RouteLayer configured from .env, or None when nothing is blocked or cached.
+    """
+    global _route_layer
+    if _route_layer is None and (block_resource_types or block_url_patterns or response_cache_dir):
+        cache = ResponseCache(response_cache_dir, response_cache_ttl, int(response_cache_max_mb * 1024 * 1024)) \
+            if response_cache_dir else None
+        _route_layer = RouteLayer(_split(block_resource_types), _split(block_url_patterns), cache,
+                                  _split(response_cache_types))
+    return _route_layer
@@ -0,0 +1,169 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+import atexit
+import csv
+import json
+import os
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from framework_inject.constants import RUNNER_REPORT_DIR, LOG_TIME_STRUCTURE, CDP_PERFORMANCE_METRICS, \
+    CDP_PERFORMANCE_COUNTERS
+from framework_inject.base.scripts import PAGE_METRICS_JS
+from framework_inject.logger.logger import Logger
+from framework_inject.logger.log_context import get_log_context
+from framework_inject.step_timing import StepRecord
+
+load_dotenv()
+page_metrics = os.getenv("PAGE_METRICS", "False").lower() == "true"
+
+
+def flatten(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """{"resources": {"script": {"count": 3}}} -> {"resources.script.count": 3} for CSV export."""
+    flat = {}
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def _cdp_metrics(metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {item["name"]: item["value"] for item in metrics if item["name"] in CDP_PERFORMANCE_METRICS}
+
+
+class PageMetrics(Logger):
+    """
+    Front-end performance metrics collected after each BasePage.goto when PAGE_METRICS=True:
+    Navigation/Resource Timing, FCP, LCP and CLS from the page, plus CDP Performance.getMetrics
+    (JS heap, layout/style counts, script and task duration) on Chromium.
+
+    Metrics are read after the `goto` step has finished, so they do not add to its wall time, and are
+    attached to that step (see step_timing). The cumulative CDP counters (LayoutCount, ScriptDuration, ...)
+    are stored as the difference from the previous reading on the same page.
+    Records are kept for `save_json`/`save_csv`, which run automatically at exit.
+    """
+
+    def __init__(self, logger=__file__):
+        super().__init__(logger)
+        self.records: List[Dict[str, Any]] = []
+        self._cdp_sessions = weakref.WeakKeyDictionary()
+        self._cdp_readings = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._export_registered = False
+
+    def _cdp_session(self, page):
+        if page not in self._cdp_sessions:
+            try:
+                session = page.context.new_cdp_session(page)
+                session.send("Performance.enable")
+            except Exception as e:
+                self.logger.debug("CDP performance metrics are not available: %s", e)
+                session = None
+            self._cdp_sessions[page] = session
+        return self._cdp_sessions[page]
+
+    async def _async_cdp_session(self, page):
+        if page not in self._cdp_sessions:
+            try:
+                session = await page.context.new_cdp_session(page)
+                await session.send("Performance.enable")
+            except Exception as e:
+                self.logger.debug("CDP performance metrics are not available: %s", e)
+                session = None
+            self._cdp_sessions[page] = session
+        return self._cdp_sessions[page]
+
+    def _cdp_delta(self, page, metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
+        reading = _cdp_metrics(metrics)
+        previous = self._cdp_readings.get(page, {})
+        self._cdp_readings[page] = reading
+        return {name: value - previous.get(name, 0) if name in CDP_PERFORMANCE_COUNTERS else value
+                for name, value in reading.items()}
+
+    def _add(self, url: str, page_object: str, timing: Optional[Dict[str, Any]],
+             cdp: Optional[Dict[str, Any]], step: Optional[StepRecord]) -> Dict[str, Any]:
+        context = get_log_context()
+        record = {"time": time.time(), "scenario": context.get("scenario"), "worker": context.get("worker"),
+                  "page": page_object, "url": url, "timing": timing or {}, "cdp": cdp or {}}
+        if step is not None:
+            step.metrics.update(timing=record["timing"], cdp=record["cdp"])
+        with self._lock:
+            self.records.append(record)
+            if not self._export_registered:
+                self._export_registered = True
+                atexit.register(self.export)
+        self.logger.debug("Page metrics for %s: %s", url, record)
+        return record
+
+    def collect(self, page, url: str, page_object: str, step: Optional[StepRecord] = None) -> Dict[str, Any]:
+        """Read the metrics of the page that has just navigated to `url` and attach them to `step`."""
+        try:
+            timing = page.evaluate(PAGE_METRICS_JS)
+        except Exception as e:
+            self.logger.debug("Could not read page timing for %s: %s", url, e)
+            timing = None
+        cdp = None
+        session = self._cdp_session(page)
+        if session is not None:
+            try:
+                cdp = self._cdp_delta(page, session.send("Performance.getMetrics")["metrics"])
+            except Exception as e:
+                self.logger.debug("Could not read CDP metrics for %s: %s", url, e)
+        return self._add(url, page_object, timing, cdp, step)
+
+    async def collect_async(self, page, url: str, page_object: str,
+                            step: Optional[StepRecord] = None) -> Dict[str, Any]:
+        """`collect` for playwright.async_api pages."""
+        try:
+            timing = await page.evaluate(PAGE_METRICS_JS)
+        except Exception as e:
+            self.logger.debug("Could not read page timing for %s: %s", url, e)
+            timing = None
+        cdp = None
+        session = await self._async_cdp_session(page)
+        if session is not None:
+            try:
+                cdp = self._cdp_delta(page, (await session.send("Performance.getMetrics"))["metrics"])
+            except Exception as e:
+                self.logger.debug("Could not read CDP metrics for %s: %s", url, e)
+        return self._add(url, page_object, timing, cdp, step)
+
+    def _file_path(self, folder: str, extension: str) -> str:
+        os.makedirs(folder, exist_ok=True)
+        file_name = time.strftime(f"page-metrics{LOG_TIME_STRUCTURE}-{os.getpid()}.{extension}", time.localtime())
+        return os.path.join(folder, file_name)
+
+    def save_json(self, folder: str = RUNNER_REPORT_DIR) -> str:
+        file_path = self._file_path(folder, "json")
+        with self._lock:
+            records = list(self.records)
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=2, default=str)
+        return file_path
+
+    def save_csv(self, folder: str = RUNNER_REPORT_DIR) -> str:
+        """One row per navigation; nested metrics become dotted columns (timing.lcp, cdp.LayoutCount, ...)."""
+        file_path = self._file_path(folder, "csv")
+        with self._lock:
+            rows = [flatten(record) for record in self.records]
+        columns = list(dict.fromkeys(column for row in rows for column in row))
+        with open(file_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+        return file_path
+
+    def export(self) -> None:
+        if not self.records:
+            return
+        self.logger.info("Page metrics saved to %s and %s", self.save_json(), self.save_csv())
+
+
+metrics = PageMetrics() if page_metrics else None
@@ -0,0 +1,242 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from dotenv import load_dotenv
+
+from framework_inject.constants import RUNNER_REPORT_DIR, LOG_TIME_STRUCTURE
+from framework_inject.logger.logger import Logger, SingletonLogger
+from framework_inject.logger.log_context import log_context
+from framework_inject.tracing import retain_failure, discard_steps, is_recorded, close_context
+
+load_dotenv()
+runner_workers = os.getenv("RUNNER_WORKERS")
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    worker: str
+    passed: bool
+    started: float
+    duration: float
+    error: Optional[str] = None
+    value: Any = None
+
+
+@dataclass
+class RunReport:
+    workers: int
+    wall_time: float
+    results: List[ScenarioResult] = field(default_factory=list)
+
+    @property
+    def passed(self) -> int:
+        return sum(1 for result in self.results if result.passed)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.passed
+
+    def per_worker(self) -> Dict[str, Dict[str, float]]:
+        """Scenario count and busy time per worker."""
+        stats = {}
+        for result in self.results:
+            worker_stats = stats.setdefault(result.worker, {"scenarios": 0, "busy_time": 0.0})
+            worker_stats["scenarios"] += 1
+            worker_stats["busy_time"] += result.duration
+        return stats
+
+    def summary(self) -> str:
+        lines = [f"{'SCENARIO':<50} {'WORKER':<10} {'STATUS':<6} {'TIME, s':>8}"]
+        for result in self.results:
+            status = "PASS" if result.passed else "FAIL"
+            lines.append(f"{result.name:<50} {result.worker:<10} {status:<6} {result.duration:>8.2f}")
+        busy_time = sum(result.duration for result in self.results)
+        lines.append(f"{len(self.results)} scenarios, {self.passed} passed, {self.failed} failed; "
+                     f"wall {self.wall_time:.2f}s, busy {busy_time:.2f}s on {self.workers} workers")
+        return "\n".join(lines)
+
+    def save(self, folder: str = RUNNER_REPORT_DIR) -> str:
+        """Write the report as JSON and return its path."""
+        os.makedirs(folder, exist_ok=True)
+        file_name = time.strftime(f"run{LOG_TIME_STRUCTURE}.json", time.localtime())
+        file_path = os.path.join(folder, file_name)
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump({"workers": self.workers, "wall_time": self.wall_time, "passed": self.passed,
+                       "failed": self.failed, "per_worker": self.per_worker(),
+                       "results": [asdict(result) for result in self.results]}, f, indent=2, default=str)
+        return file_path
+
+
+def reset_process_state(close_browser: bool = False) -> None:
+    """
+    Forget the process-wide singletons (RunBrowser, BrowserFactory, BrowserPool, Context, SingletonLogger),
+    so the next use creates them again for the current process. With `close_browser` the browser is closed
+    and its Playwright driver stopped first.
+    The logger is opened again right away, so loggers taken before the reset keep writing (to the new file).
+    """
+    from framework_inject.browser import Singleton, RunBrowser, BrowserFactory
+    from framework_inject.browser_pool import BrowserPool
+    from framework_inject.base.context import Context
+
+    if close_browser:
+        if RunBrowser in Singleton._instances:
+            run_browser = RunBrowser()
+            try:
+                if run_browser.page is not None and is_recorded(run_browser.page.context):
+                    close_context(run_browser.page.context)
+            except Exception:
+                pass
+            try:
+                if run_browser.launcher is not None:
+                    run_browser.launcher.close_browser()
+                else:
+                    run_browser.browser.close()
+            except Exception:
+                pass
+        if BrowserPool in Singleton._instances:
+            BrowserPool().close()
+    RunBrowser.clear()
+    BrowserFactory.clear()
+    BrowserPool.clear()
+    Context.reset()
+    SingletonLogger.reset()
+    SingletonLogger()
+
+
+def reset_scenario_state() -> None:
+    """Give the next scenario a fresh browser context and Context() without restarting the browser."""
+    from framework_inject.browser import Singleton, RunBrowser
+    from framework_inject.base.context import Context
+
+    if RunBrowser in Singleton._instances:
+        RunBrowser().reset()
+    Context.reset()
+
+
+def _scenario_name(scenario) -> str:
+    if isinstance(scenario, str):
+        return scenario
+    return f"{scenario.__module__}:{scenario.__qualname__}"
+
+
+def _resolve_scenario(scenario) -> Callable:
+    """Accept a callable or a 'package.module:function' string."""
+    if callable(scenario):
+        return scenario
+    module_name, _, attr = scenario.partition(":")
+    target = importlib.import_module(module_name)
+    for part in attr.split("."):
+        target = getattr(target, part)
+    return target
+
+
+_worker_name = None
+
+
+def _init_worker(worker_ids) -> None:
+    global _worker_name
+    _worker_name = f"worker-{worker_ids.get()}"
+    os.environ["LOG_WORKER"] = _worker_name
+    reset_process_state()
+
+
+def _run_scenario(scenario, fresh_context: bool) -> ScenarioResult:
+    name = _scenario_name(scenario)
+    worker = _worker_name or f"pid-{os.getpid()}"
+    logger = Logger(__file__).logger
+    with log_context(scenario=name, worker=worker):
+        logger.info(f"[{worker}] Start scenario {name}")
+        started = time.time()
+        start = time.perf_counter()
+        try:
+            value = _resolve_scenario(scenario)()
+            result = ScenarioResult(name, worker, True, started, time.perf_counter() - start, value=value)
+        except Exception:
+            error = traceback.format_exc()
+            logger.error(f"[{worker}] Scenario {name} failed:\n{error}")
+            result = ScenarioResult(name, worker, False, started, time.perf_counter() - start, error=error)
+        # Bookkeeping after the scenario must not change or lose its result
+        try:
+            if result.passed:
+                discard_steps()
+            else:
+                retain_failure(name)
+        except Exception:
+            logger.warning(f"[{worker}] Could not save or drop the trace of {name}:\n{traceback.format_exc()}")
+        if fresh_context:
+            try:
+                reset_scenario_state()
+            except Exception:
+                logger.warning(f"[{worker}] Could not reset the browser context after {name}:\n"
+                               f"{traceback.format_exc()}")
+        logger.info(f"[{worker}] Finish scenario {name} in {result.duration:.2f}s")
+    return result
+
+
+class ScenarioRunner(Logger):
+    """
+    Shards scenarios (callables or 'module:function' strings) across worker processes.
+
+    Every worker is a spawned process with its own browser, Context and log file (logs/log-...-worker-N.log).
+    Callables must be importable top-level functions so they can be sent to the workers.
+    With `fresh_context` every scenario starts in a new browser context (RunBrowser.reset()).
+    """
+
+    def __init__(self, workers: Optional[int] = None, fresh_context: bool = False, logger=__file__):
+        super().__init__(logger)
+        self.workers = workers or int(runner_workers or os.cpu_count() or 1)
+        self.fresh_context = fresh_context
+
+    def run(self, scenarios: Sequence[Callable | str]) -> RunReport:
+        """
+        Run the scenarios and merge the results, in input order, into one report.
+        """
+        workers = max(1, min(self.workers, len(scenarios)))
+        mp_context = multiprocessing.get_context("spawn")
+        worker_ids = mp_context.Queue()
+        for worker_id in range(workers):
+            worker_ids.put(worker_id)
+
+        self.logger.info(f"Running {len(scenarios)} scenarios on {workers} workers")
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context,
+                                 initializer=_init_worker, initargs=(worker_ids,)) as executor:
+            futures = [executor.submit(_run_scenario, scenario, self.fresh_context) for scenario in scenarios]
+            results = []
+            for scenario, future in zip(scenarios, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(ScenarioResult(_scenario_name(scenario), "-", False, time.time(), 0.0,
+                                                  error=f"Worker failure: {e}"))
+        report = RunReport(workers, time.perf_counter() - start, results)
+        self.logger.info(f"Run finished:\n{report.summary()}")
+        return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run scenarios across worker processes.")
+    parser.add_argument("scenarios", nargs="+", help="Scenarios as 'package.module:function'")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (RUNNER_WORKERS)")
+    parser.add_argument("--fresh-context", action="store_true", help="New browser context for every scenario")
+    args = parser.parse_args(argv)
+
+    report = ScenarioRunner(args.workers, args.fresh_context).run(args.scenarios)
+    print(report.summary())
+    print(f"Report: {report.save()}")
+    return 0 if report.failed == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
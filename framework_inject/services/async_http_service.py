@@ -0,0 +1,97 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+import asyncio
+import os
+from typing import Any, AsyncIterator, Awaitable, Iterable, List
+
+import httpx
+from dotenv import load_dotenv
+
+from framework_inject.constants import DEFAULT_HTTP_CONCURRENCY
+from framework_inject.logger.logger import Logger
+from framework_inject.step_timing import timed
+from framework_inject.services.http_session import http_timeout, http_retries, body_for_log, truncate_for_log
+
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+load_dotenv()
+http_concurrency = int(os.getenv("HTTP_CONCURRENCY", DEFAULT_HTTP_CONCURRENCY))
+
+
+class AsyncAPI(Logger):
+    """
+    asyncio counterpart of API with get/post/status semantics.
+
+    All calls share one connection pool (HTTP/2 when `h2` is installed) and at most `concurrency`
+    requests are in flight at once, so callers can fan out freely with `gather_calls`/`as_completed`.
+    Connection errors are retried `retries` times by the transport.
+    """
+
+    def __init__(self, site, concurrency: int = http_concurrency, http2: bool = True,
+                 timeout: float = http_timeout, retries: int = http_retries, logger=__file__):
+        super().__init__(logger)
+        self.site = site
+        self.concurrency = concurrency
+        use_http2 = http2 and h2 is not None
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        transport = httpx.AsyncHTTPTransport(http2=use_http2, retries=retries, limits=limits)
+        self.client = httpx.AsyncClient(transport=transport, timeout=timeout)
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    @timed(target="get")
+    async def status(self, get) -> httpx.Response:
+        '''
+        :return: response > response.status_code
+        '''
+        self.logger.debug("Trying to get status code")
+        async with self.semaphore:
+            return await self.client.get(self.site + get)
+
+    @timed(target="get")
+    async def get(self, get):
+        self.logger.debug("Trying to get Json")
+        async with self.semaphore:
+            req = await self.client.get(self.site + get)
+        try:
+            return req.json()
+        except ValueError:
+            return "NOT JSON!"
+
+    @timed(target="get")
+    async def post(self, get, data) -> httpx.Response:
+        self.logger.debug("Trying to send POST data to: " + str(self.site + get) + " With data: " + truncate_for_log(data))
+        async with self.semaphore:
+            result = await self.client.post(self.site + get, data=data)
+        self.logger.debug("Got response: " + str(result) + "With data: " + body_for_log(result))
+        return result
+
+    @staticmethod
+    async def gather_calls(calls: Iterable[Awaitable], return_exceptions: bool = False) -> List[Any]:
+        """Await the calls concurrently and return their results in input order."""
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+
+    @staticmethod
+    async def as_completed(calls: Iterable[Awaitable]) -> AsyncIterator[Any]:
+        """Yield results of the calls as soon as each one completes."""
+        for future in asyncio.as_completed(list(calls)):
+            yield await future
+
+    async def get_many(self, paths: Iterable[str]) -> List[Any]:
+        """`get` every path concurrently (bounded by `concurrency`); results in input order."""
+        return await self.gather_calls(self.get(path) for path in paths)
+
+    async def post_many(self, requests: Iterable[tuple]) -> List[httpx.Response]:
+        """`post` every (path, data) pair concurrently (bounded by `concurrency`); results in input order."""
+        return await self.gather_calls(self.post(path, data) for path, data in requests)
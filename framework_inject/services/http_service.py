@@ -1,27 +1,44 @@
 """Framework: https://github.com/eshut/Inject-Framework"""
 
+import json
+from typing import Any, Iterator
+
 import requests
 
+from framework_inject.constants import DOWNLOAD_CHUNK_SIZE
 from framework_inject.logger.logger import Logger
+from framework_inject.services.http_session import get_session, body_for_log, truncate_for_log, stream_to_file, \
+    retries_of
+from framework_inject.step_timing import timed, add_retries
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 
 class API(Logger):
-    def __init__(self, site, logger=__file__):
+    def __init__(self, site, logger=__file__, *, session: requests.Session = None):
         super().__init__(logger)
         self.site = site
+        self.session = session or get_session()
 
+    @timed(target="get")
     def status(self, get):
         '''
         :return: request > request.status_code
         '''
         self.logger.debug("Trying to get status code")
-        req = requests.get(self.site + get)
+        req = self.session.get(self.site + get)
+        add_retries(retries_of(req))
         result = req
         return result
 
+    @timed(target="get")
     def get(self, get):
         self.logger.debug("Trying to get Json")
-        req = requests.get(self.site + get)
+        req = self.session.get(self.site + get)
+        add_retries(retries_of(req))
         result = req.status_code
         try:
             json = req.json()
@@ -29,8 +46,49 @@ class API(Logger):
         except:
             return "NOT JSON!"
 
+    @timed(target="get")
     def post(self, get, data):
-        self.logger.debug("Trying to send POST data to: " + str(self.site + get) + " With data: " + str(data))
-        result = requests.post(self.site + get, data=data)
-        self.logger.debug("Got response: " + str(result) + "With data: " + str(result.text))
+        self.logger.debug("Trying to send POST data to: " + str(self.site + get) + " With data: " + truncate_for_log(data))
+        result = self.session.post(self.site + get, data=data)
+        add_retries(retries_of(result))
+        self.logger.debug("Got response: " + str(result) + "With data: " + body_for_log(result))
         return result
+
+    @timed(target="get")
+    def download(self, get, file_path, chunk_size=DOWNLOAD_CHUNK_SIZE) -> int:
+        '''
+        Stream a (large) response body to disk, holding at most chunk_size bytes in memory.
+        :return: bytes written
+        '''
+        self.logger.debug("Trying to download " + str(self.site + get) + " to " + str(file_path))
+        with self.session.get(self.site + get, stream=True) as req:
+            add_retries(retries_of(req))
+            req.raise_for_status()
+            written = stream_to_file(req, file_path, chunk_size)
+        self.logger.debug(f"Downloaded {written} bytes to {file_path}")
+        return written
+
+    def iter_json_lines(self, get) -> Iterator[Any]:
+        '''
+        Iterate an NDJSON (JSON lines) response one record at a time without buffering the body.
+        '''
+        self.logger.debug("Trying to stream JSON lines")
+        with self.session.get(self.site + get, stream=True) as req:
+            req.raise_for_status()
+            for line in req.iter_lines(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                if line:
+                    yield json.loads(line)
+
+    def iter_json_items(self, get, prefix="item") -> Iterator[Any]:
+        '''
+        Incrementally parse a large JSON document and yield the objects under `prefix`
+        ("item" = elements of a top-level array, "data.item" = elements of {"data": [...]}).
+        Requires the optional `ijson` package.
+        '''
+        if ijson is None:
+            raise ImportError("iter_json_items requires the 'ijson' package")
+        self.logger.debug("Trying to stream JSON items")
+        with self.session.get(self.site + get, stream=True) as req:
+            req.raise_for_status()
+            req.raw.decode_content = True
+            yield from ijson.items(req.raw, prefix)
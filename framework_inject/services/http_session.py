@@ -0,0 +1,109 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+import os
+import threading
+from typing import Optional
+
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from framework_inject.constants import DEFAULT_HTTP_POOL_SIZE, DEFAULT_HTTP_TIMEOUT_SEC, DEFAULT_HTTP_RETRIES, \
+    DEFAULT_HTTP_BACKOFF_SEC, HTTP_BACKOFF_JITTER_SEC, HTTP_RETRY_STATUS_CODES, LOG_BODY_LIMIT, DOWNLOAD_CHUNK_SIZE
+
+load_dotenv()
+http_pool_size = int(os.getenv("HTTP_POOL_SIZE", DEFAULT_HTTP_POOL_SIZE))
+http_timeout = float(os.getenv("HTTP_TIMEOUT_SEC", DEFAULT_HTTP_TIMEOUT_SEC))
+http_retries = int(os.getenv("HTTP_RETRIES", DEFAULT_HTTP_RETRIES))
+
+
+class PooledSession(requests.Session):
+    """
+    requests.Session with keep-alive connection pools, a default timeout and retries
+    with jittered exponential backoff for idempotent methods (GET, HEAD, PUT, DELETE, OPTIONS, TRACE).
+    """
+
+    def __init__(self, pool_size: int = http_pool_size, timeout: Optional[float] = http_timeout,
+                 retries: int = http_retries, backoff: float = DEFAULT_HTTP_BACKOFF_SEC):
+        super().__init__()
+        self.timeout = timeout
+        retry = Retry(total=retries, backoff_factor=backoff, backoff_jitter=HTTP_BACKOFF_JITTER_SEC,
+                      status_forcelist=HTTP_RETRY_STATUS_CODES, allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+                      respect_retry_after_header=True, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> PooledSession:
+    """Process-wide PooledSession configured from .env (HTTP_POOL_SIZE, HTTP_TIMEOUT_SEC, HTTP_RETRIES)."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = PooledSession()
+    return _session
+
+
+def retries_of(response) -> int:
+    """Number of retries urllib3 made before returning a requests response."""
+    retries = getattr(response.raw, "retries", None)
+    return len(retries.history) if retries is not None else 0
+
+
+def truncate_for_log(value, limit: int = LOG_BODY_LIMIT) -> str:
+    """String form of `value` cut to `limit` characters, with the original length noted."""
+    text = str(value)
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}... <{len(text)} chars>"
+
+
+def body_for_log(response, limit: int = LOG_BODY_LIMIT) -> str:
+    """
+    Response body for debug logs: not read at all when Content-Length is above `limit`, truncated otherwise.
+    Works for requests and httpx responses; streamed responses are never read.
+    """
+    length = response.headers.get("content-length")
+    if length and length.isdigit() and int(length) > limit:
+        return f"<{length} bytes, not logged>"
+    if getattr(response, "_content", None) is False:
+        # requests response opened with stream=True and not read yet
+        return "<streamed body, not logged>"
+    try:
+        text = response.text
+    except Exception:
+        # httpx streaming response that has not been read
+        return "<streamed body, not logged>"
+    return truncate_for_log(text, limit)
+
+
+def stream_to_file(response, file_path: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> int:
+    """
+    Write a `stream=True` requests response to disk chunk by chunk, so at most `chunk_size` bytes are held
+    in memory. The file appears under its final name only when complete.
+
+    Returns:
+        int: Bytes written.
+    """
+    tmp_path = f"{file_path}.{os.getpid()}.part"
+    written = 0
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+                written += len(chunk)
+        os.replace(tmp_path, file_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return written
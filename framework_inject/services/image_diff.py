@@ -0,0 +1,168 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from framework_inject.constants import PIXEL_DIFF, SSIM_DIFF, PHASH_DIFF, IMAGE_DIFF_MODES, IMAGE_DIFF_THRESHOLDS
+
+ImageSource = Union[str, bytes, bytearray, memoryview, Image.Image, np.ndarray]
+Region = Tuple[int, int, int, int]
+
+_SSIM_C1 = (0.01 * 255) ** 2
+_SSIM_C2 = (0.03 * 255) ** 2
+_PHASH_SIZE = 32
+_PHASH_BITS = 8
+
+
+@dataclass
+class DiffResult:
+    """
+    Outcome of one comparison.
+
+    `score` is the difference in the unit of `mode`: percent of differing pixels (pixel),
+    (1 - SSIM) * 100 (ssim) or the Hamming distance of the 64-bit hashes (phash).
+    `passed` is `score <= threshold`.
+    """
+    mode: str
+    score: float
+    threshold: float
+    passed: bool
+    error: Optional[str] = None
+
+
+def load_gray(source: ImageSource) -> np.ndarray:
+    """
+    Grayscale uint8 array from a file path, encoded bytes (e.g. `page.screenshot()`), a PIL image
+    or an existing array. Nothing is written to disk.
+    """
+    if isinstance(source, np.ndarray):
+        if source.ndim == 3 and source.shape[2] == 4:
+            return cv2.cvtColor(source, cv2.COLOR_BGRA2GRAY)
+        if source.ndim == 3 and source.shape[2] == 1:
+            return source[:, :, 0]
+        if source.ndim == 3:
+            return cv2.cvtColor(source, cv2.COLOR_BGR2GRAY)
+        return source
+    if isinstance(source, Image.Image):
+        return np.asarray(source.convert("L"))
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        image = cv2.imdecode(np.frombuffer(source, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+    else:
+        image = cv2.imread(os.fspath(source), cv2.IMREAD_GRAYSCALE)
+    if image is None:
+        raise ValueError(f"Can not decode image: {source if isinstance(source, str) else type(source).__name__}")
+    return image
+
+
+def region_mask(shape: Tuple[int, int], ignore: Optional[Iterable[Region]] = None) -> np.ndarray:
+    """Boolean mask of `shape`, False inside every ignored (x, y, width, height) region."""
+    mask = np.ones(shape, dtype=bool)
+    for x, y, width, height in ignore or ():
+        mask[max(y, 0):y + height, max(x, 0):x + width] = False
+    return mask
+
+
+def _pixel_score(image_1: np.ndarray, image_2: np.ndarray, mask: np.ndarray, tolerance: int) -> float:
+    diff = cv2.absdiff(image_1, image_2) > tolerance
+    compared = np.count_nonzero(mask)
+    if not compared:
+        return 0.0
+    return np.count_nonzero(diff & mask) * 100 / compared
+
+
+def _ssim_score(image_1: np.ndarray, image_2: np.ndarray, mask: np.ndarray) -> float:
+    a = image_1.astype(np.float64)
+    b = image_2.astype(np.float64)
+    blur = lambda image: cv2.GaussianBlur(image, (11, 11), 1.5)
+    mu_a, mu_b = blur(a), blur(b)
+    mu_aa, mu_bb, mu_ab = mu_a * mu_a, mu_b * mu_b, mu_a * mu_b
+    sigma_aa = blur(a * a) - mu_aa
+    sigma_bb = blur(b * b) - mu_bb
+    sigma_ab = blur(a * b) - mu_ab
+    ssim_map = ((2 * mu_ab + _SSIM_C1) * (2 * sigma_ab + _SSIM_C2)) / \
+               ((mu_aa + mu_bb + _SSIM_C1) * (sigma_aa + sigma_bb + _SSIM_C2))
+    if not mask.any():
+        return 0.0
+    return float((1 - ssim_map[mask].mean()) * 100)
+
+
+def perceptual_hash(image: np.ndarray) -> np.ndarray:
+    """64-bit DCT perceptual hash as a boolean array."""
+    small = cv2.resize(image, (_PHASH_SIZE, _PHASH_SIZE), interpolation=cv2.INTER_AREA).astype(np.float32)
+    low = cv2.dct(small)[:_PHASH_BITS, :_PHASH_BITS].flatten()
+    return low > np.median(low[1:])
+
+
+def _phash_score(image_1: np.ndarray, image_2: np.ndarray, mask: np.ndarray) -> float:
+    if not mask.all():
+        image_1 = np.where(mask, image_1, 0).astype(np.uint8)
+        image_2 = np.where(mask, image_2, 0).astype(np.uint8)
+    return float(np.count_nonzero(perceptual_hash(image_1) != perceptual_hash(image_2)))
+
+
+def compare(source_1: ImageSource, source_2: ImageSource, mode: str = PIXEL_DIFF,
+            threshold: Optional[float] = None, tolerance: int = 0,
+            ignore: Optional[Sequence[Region]] = None) -> DiffResult:
+    """
+    Compare two images in memory. The second one is resized to the size of the first if they differ.
+
+    Args:
+        mode (str): "pixel", "ssim" or "phash".
+        threshold (float, optional): Highest `score` that still passes. Defaults to IMAGE_DIFF_THRESHOLDS[mode].
+        tolerance (int): Pixel mode only - per-pixel intensity difference (0-255) not counted as a change,
+            absorbs anti-aliasing and compression noise.
+        ignore (list, optional): (x, y, width, height) regions of the first image left out of the comparison,
+            e.g. clocks, carousels or ads.
+    """
+    if mode not in IMAGE_DIFF_MODES:
+        raise ValueError(f"Unknown diff mode '{mode}', expected one of {IMAGE_DIFF_MODES}")
+    if threshold is None:
+        threshold = IMAGE_DIFF_THRESHOLDS[mode]
+    image_1 = load_gray(source_1)
+    image_2 = load_gray(source_2)
+    if image_1.shape != image_2.shape:
+        image_2 = cv2.resize(image_2, (image_1.shape[1], image_1.shape[0]), interpolation=cv2.INTER_AREA)
+    mask = region_mask(image_1.shape, ignore)
+    if mode == SSIM_DIFF:
+        score = _ssim_score(image_1, image_2, mask)
+    elif mode == PHASH_DIFF:
+        score = _phash_score(image_1, image_2, mask)
+    else:
+        score = _pixel_score(image_1, image_2, mask, tolerance)
+    return DiffResult(mode, score, threshold, score <= threshold)
+
+
+def _compare_pair(pair, options) -> DiffResult:
+    try:
+        return compare(pair[0], pair[1], **options)
+    except Exception as err:
+        mode = options.get("mode", PIXEL_DIFF)
+        threshold = options.get("threshold")
+        if threshold is None:
+            threshold = IMAGE_DIFF_THRESHOLDS.get(mode, 0)
+        return DiffResult(mode, float("inf"), threshold, False, error=repr(err))
+
+
+def compare_many(pairs: Iterable[Tuple[ImageSource, ImageSource]], workers: Optional[int] = None,
+                 chunksize: int = 8, **options) -> List[DiffResult]:
+    """
+    Compare many (image_1, image_2) pairs across a process pool; results in input order.
+
+    Pairs should be file paths or encoded bytes so they are cheap to send to the workers. A pair that
+    fails to load gets a failed DiffResult with `error` set instead of aborting the batch.
+    Options are passed to `compare`.
+    """
+    pairs = list(pairs)
+    workers = min(workers or os.cpu_count() or 1, len(pairs) or 1)
+    if workers == 1:
+        return [_compare_pair(pair, options) for pair in pairs]
+    mp_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+        return list(executor.map(_compare_pair, pairs, [options] * len(pairs), chunksize=chunksize))
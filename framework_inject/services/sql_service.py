@@ -1,21 +1,192 @@
 """Framework: https://github.com/eshut/Inject-Framework"""
 
+import hashlib
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+import dotenv
 import mysql.connector
+from framework_inject.constants import DEFAULT_DB_POOL_SIZE, DB_POOL_TIMEOUT_SEC, DEFAULT_DB_BATCH_SIZE, \
+    DEFAULT_DB_FETCH_SIZE
 from framework_inject.logger.logger import Logger
+from framework_inject.step_timing import add_retries
+
+dotenv.load_dotenv()
+db_pool_size = int(os.getenv("DB_POOL_SIZE", DEFAULT_DB_POOL_SIZE))
+
+
+class ConnectionPool(Logger):
+    """
+    Thread-safe pool of mysql.connector connections.
+
+    Connections are opened lazily up to `size`, health-checked with a ping (reconnecting only if it fails)
+    when checked out, and rolled back if a transaction is still open when they are returned.
+    """
+
+    def __init__(self, size=db_pool_size, logger=__file__, **connect_kwargs):
+        super().__init__(logger)
+        self.size = size
+        self.connect_kwargs = connect_kwargs
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        return mysql.connector.connect(**self.connect_kwargs)
+
+    def get_connection(self, timeout=DB_POOL_TIMEOUT_SEC):
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                try:
+                    return self._connect()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            try:
+                connection = self._idle.get(timeout=timeout)
+            except queue.Empty:
+                raise mysql.connector.errors.PoolError(f"No free connection in pool within {timeout} seconds")
+        try:
+            connection.ping(reconnect=True, attempts=1, delay=0)
+        except mysql.connector.Error:
+            with self._lock:
+                self._created -= 1
+            self.logger.warning("Database connection lost. Opening a new one...")
+            add_retries()
+            return self.get_connection(timeout)
+        return connection
+
+    def put_connection(self, connection):
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+        except mysql.connector.Error:
+            pass
+        self._idle.put(connection)
+
+    def discard(self, connection):
+        """Close a connection instead of returning it (e.g. with unread streamed rows) and free its slot."""
+        try:
+            connection.close()
+        except mysql.connector.Error:
+            pass
+        with self._lock:
+            self._created -= 1
+
+    @contextmanager
+    def connection(self, timeout=DB_POOL_TIMEOUT_SEC):
+        """Check a connection out for the duration of a `with` block."""
+        connection = self.get_connection(timeout)
+        try:
+            yield connection
+        finally:
+            self.put_connection(connection)
+
+    def close_all(self):
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if connection.is_connected():
+                connection.close()
+            with self._lock:
+                self._created -= 1
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def new_connection_pool(host, user, password, database, port, size=db_pool_size) -> ConnectionPool:
+    """Private ConnectionPool, not shared with other SQL/SQLUtil instances."""
+    return ConnectionPool(size, host=host, user=user, password=password, database=database,
+                          port=int(port), collation="utf8mb4_general_ci")
+
+
+def get_connection_pool(host, user, password, database, port, size=db_pool_size):
+    """Process-wide ConnectionPool shared by every SQL/SQLUtil with the same connection settings."""
+    # The password is part of the settings, but only its hash is kept in the key
+    password_hash = hashlib.sha256(str(password).encode("utf-8")).hexdigest()
+    key = (host, user, password_hash, database, int(port))
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = new_connection_pool(host, user, password, database, port, size)
+        return _pools[key]
+
+
+def iter_query(pool, script, args=None, dictionary=False, chunk_size=None,
+               fetch_size=DEFAULT_DB_FETCH_SIZE) -> Iterator:
+    """
+    Run a SELECT on an unbuffered cursor and yield rows lazily, `fetch_size` rows per network read.
+
+    The pooled connection is held until the iterator is exhausted or closed. If it is closed early the
+    connection is discarded rather than draining the remaining rows from the server.
+
+    Args:
+        chunk_size (int, optional): Yield lists of up to `chunk_size` rows instead of single rows.
+    """
+    connection = pool.get_connection()
+    exhausted = False
+    try:
+        cursor = connection.cursor(dictionary=dictionary, buffered=False)
+        cursor.execute(script, args)
+        size = chunk_size or fetch_size
+        while rows := cursor.fetchmany(size):
+            if chunk_size:
+                yield rows
+            else:
+                yield from rows
+        exhausted = True
+        cursor.close()
+    finally:
+        if exhausted:
+            pool.put_connection(connection)
+        else:
+            pool.discard(connection)
+
+
+@dataclass
+class BulkResult:
+    """Outcome of SQL.bulk_update: affected rows, executed batches and `lastrowid` of every batch."""
+    rowcount: int = 0
+    batches: int = 0
+    last_ids: List[int] = field(default_factory=list)
+
+
+def iter_batches(rows: Iterable, batch_size: int):
+    """Split any iterable of parameter tuples into lists of at most `batch_size` items."""
+    iterator = iter(rows)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
 
 
 class SQL(Logger):
-    def __init__(self, host, user, password, database, port, dictionary=False, logger=__file__):
+    def __init__(self, host, user, password, database, port, dictionary=False, logger=__file__, *,
+                 pool_size=db_pool_size, pool=None):
         super().__init__(logger)
-        self.db = mysql.connector.connect(
-            host=host,
-            user=user,
-            password=password,
-            database=database,
-            port=int(port),
-            collation="utf8mb4_general_ci"
-        )
+        self.pool = pool or get_connection_pool(host, user, password, database, port, pool_size)
         self.dictionary = dictionary
+        self._db = None
+
+    @property
+    def db(self):
+        """Connection held for direct cursor()/commit() use; run_script/update_data use the pool per query."""
+        if self._db is None:
+            self._db = self.pool.get_connection()
+        return self._db
 
     def cursor(self, dictionary=None):
         if dictionary is None:
@@ -23,33 +194,86 @@ class SQL(Logger):
         return self.db.cursor(dictionary=dictionary)
 
     def run_script(self, script, args=None, dictionary=None):
+        if dictionary is None:
+            dictionary = self.dictionary
         try:
-            cursor = self.cursor(dictionary=dictionary)
-            cursor.execute(script, args)
-            result = cursor.fetchall()
-            cursor.close()
-            return result
+            with self.pool.connection() as db:
+                cursor = db.cursor(dictionary=dictionary)
+                cursor.execute(script, args)
+                result = cursor.fetchall()
+                cursor.close()
+                return result
         except mysql.connector.Error as err:
             self.logger.error(f"Error executing script: {err}")
             return None
 
+    def iter_script(self, script, args=None, dictionary=None, chunk_size=None) -> Iterator:
+        """Stream the result of a SELECT row by row (or in `chunk_size` lists) instead of fetchall()."""
+        if dictionary is None:
+            dictionary = self.dictionary
+        return iter_query(self.pool, script, args, dictionary, chunk_size)
+
     def update_data(self, query, args=None):
         try:
-            self.db.reconnect()
-            cursor = self.cursor()
-            result_exec = cursor.execute(query, args)
-            cursor_id = cursor.lastrowid
-            result_commit = self.db.commit()
-            result_close = cursor.close()
-            self.logger.debug(f"Query executed successfully: {query}")
-            return cursor_id
+            with self.pool.connection() as db:
+                try:
+                    cursor = db.cursor()
+                    cursor.execute(query, args)
+                    cursor_id = cursor.lastrowid
+                    db.commit()
+                    cursor.close()
+                    self.logger.debug(f"Query executed successfully: {query}")
+                    return cursor_id
+                except mysql.connector.Error:
+                    db.rollback()
+                    raise
         except mysql.connector.Error as err:
             self.logger.error(f"Error executing update query: {err}")
-            self.db.rollback()
+
+    def bulk_update(self, query, rows: Iterable, batch_size=DEFAULT_DB_BATCH_SIZE,
+                    commit_per_batch=False) -> Optional[BulkResult]:
+        """
+        Run one statement for many parameter tuples with executemany, `batch_size` rows at a time.
+
+        Args:
+            query (str): INSERT/UPDATE/DELETE statement with %s placeholders.
+            rows (Iterable): Parameter tuples; consumed lazily, so generators of any size are fine.
+            batch_size (int): Rows per executemany call (mysql.connector sends a multi-row INSERT per batch).
+            commit_per_batch (bool): Commit after every batch instead of once in a single transaction.
+
+        Returns:
+            BulkResult | None: Affected rows and the lastrowid of each batch (first generated id of a multi-row
+            INSERT), or None on error. On error the open transaction is rolled back; with `commit_per_batch`
+            earlier batches stay committed.
+        """
+        result = BulkResult()
+        try:
+            with self.pool.connection() as db:
+                cursor = db.cursor()
+                try:
+                    for batch in iter_batches(rows, batch_size):
+                        cursor.executemany(query, batch)
+                        result.rowcount += max(cursor.rowcount, 0)
+                        result.batches += 1
+                        result.last_ids.append(cursor.lastrowid)
+                        if commit_per_batch:
+                            db.commit()
+                    db.commit()
+                except mysql.connector.Error:
+                    db.rollback()
+                    raise
+                finally:
+                    cursor.close()
+            self.logger.debug(f"Bulk query executed successfully: {result.rowcount} rows in {result.batches} batches")
+            return result
+        except mysql.connector.Error as err:
+            self.logger.error(f"Error executing bulk query after {result.batches} batches: {err}")
+            return None
 
     def close_connect(self):
-        if self.db.is_connected():
-            self.db.close()
+        if self._db is not None:
+            self.pool.put_connection(self._db)
+            self._db = None
 
     def commit(self):
         result = self.db.commit()
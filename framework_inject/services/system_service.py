@@ -7,12 +7,11 @@ from random import choice
 from string import ascii_lowercase, ascii_uppercase
 from string import digits
 
-import cv2
-import numpy as np
 import pyautogui
-from PIL import Image
 
 from framework.Base.BaseElement import *
+from framework_inject.constants import PIXEL_DIFF, IMAGE_DIFF_FAILED
+from framework_inject.services.image_diff import compare, compare_many
 
 FILES = jsonGetter.GetJson.get_file(CONFIG, "Files")
 
@@ -38,20 +37,18 @@ class SysOperations:
         return string
 
     @staticmethod
-    def compare_images(path_1, path_2):
-        image1 = Image.open(path_1)
-        size = image1.size
-        image2 = Image.open(path_2)
-        image2 = image2.convert("RGB")
-        new_image2 = image2.resize(size)
-        new_image2.save(path_2, quality=95)
-
-        img1 = cv2.imread(path_1, 0)
-        img2 = cv2.imread(path_2, 0)
-
+    def compare_images(path_1, path_2, mode=PIXEL_DIFF, tolerance=0, ignore=None):
+        """
+        Difference between two images (paths or screenshot bytes), compared in memory; neither file is modified.
+        Pixel mode returns the percentage of differing pixels, see image_diff.compare for other modes.
+        Returns IMAGE_DIFF_FAILED if an image can not be read.
+        """
         try:
-            res = cv2.absdiff(img2, img1)
-            percentage = (np.count_nonzero(res) * 100) / res.size
-        except:
-            percentage = 99999
-        return percentage
+            return compare(path_1, path_2, mode=mode, tolerance=tolerance, ignore=ignore).score
+        except Exception:
+            return IMAGE_DIFF_FAILED
+
+    @staticmethod
+    def compare_images_many(pairs, workers=None, **options):
+        """Compare many (path_1, path_2) pairs in a process pool; returns a DiffResult per pair in input order."""
+        return compare_many(pairs, workers=workers, **options)
@@ -0,0 +1,256 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+import atexit
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict, field
+from typing import Any, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from framework_inject.constants import RUNNER_REPORT_DIR, LOG_TIME_STRUCTURE, STEP_TARGET_LIMIT, STEP_PERCENTILES
+from framework_inject.logger.logger import Logger
+from framework_inject.logger.log_context import log_context, get_log_context
+
+load_dotenv()
+step_timing = os.getenv("STEP_TIMING", "False").lower() == "true"
+
+
+@dataclass
+class StepRecord:
+    """
+    One timed action. `wall` is the whole call and `wait` the part of it spent in waits (wait_for_element, ...),
+    both in seconds; `retries` counts the retries reported while it ran (HTTP, database reconnects).
+    """
+    component: str
+    action: str
+    target: Optional[str]
+    started: float
+    wall: float = 0.0
+    wait: float = 0.0
+    retries: int = 0
+    ok: bool = True
+    error: Optional[str] = None
+    scenario: Optional[str] = None
+    depth: int = 0
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+
+_current_step: ContextVar[Optional[StepRecord]] = ContextVar("current_step", default=None)
+_last_step: ContextVar[Optional[StepRecord]] = ContextVar("last_step", default=None)
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of `values` (q in 0..100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(int(-(-q * len(ordered) // 100)), 1)
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _stats(records: List[StepRecord]) -> Dict[str, Any]:
+    walls = [record.wall for record in records]
+    stats = {"count": len(records), "failed": sum(not record.ok for record in records),
+             "retries": sum(record.retries for record in records),
+             "wait": sum(record.wait for record in records), "max": max(walls)}
+    for q in STEP_PERCENTILES:
+        stats[f"p{q}"] = percentile(walls, q)
+    return stats
+
+
+class StepTimings(Logger):
+    """
+    Collects StepRecords of the current process and aggregates them per component (page object, API,
+    Database) and per action + target. With STEP_TIMING=True the report is written when the process exits.
+    """
+
+    def __init__(self, logger=__file__):
+        super().__init__(logger)
+        self.records: List[StepRecord] = []
+        self._lock = threading.Lock()
+        self._report_registered = False
+
+    def add(self, record: StepRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+            if not self._report_registered:
+                self._report_registered = True
+                atexit.register(self.report)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.records = []
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        {"components": {component: stats}, "steps": {"component.action target": stats}}.
+        Component stats only count outermost steps, so nested calls (a wait inside a click) are not counted twice.
+        """
+        with self._lock:
+            records = list(self.records)
+        components: Dict[str, List[StepRecord]] = {}
+        steps: Dict[str, List[StepRecord]] = {}
+        for record in records:
+            if record.depth == 0:
+                components.setdefault(record.component, []).append(record)
+            key = f"{record.component}.{record.action}"
+            if record.target:
+                key += f" {record.target}"
+            steps.setdefault(key, []).append(record)
+        return {"components": {name: _stats(items) for name, items in components.items()},
+                "steps": {name: _stats(items) for name, items in steps.items()}}
+
+    def table(self, top: int = 20) -> str:
+        """Plain-text table of components and the `top` slowest steps by p95."""
+        summary = self.summary()
+        columns = "".join(f"{f'p{q}':>9}" for q in STEP_PERCENTILES)
+        lines = [f"{'STEP':<70} {'COUNT':>6}{columns} {'WAIT':>9} {'RETRY':>6} {'FAIL':>5}"]
+        rows = list(summary["components"].items())
+        rows += sorted(summary["steps"].items(), key=lambda item: item[1][f"p{STEP_PERCENTILES[1]}"], reverse=True)[:top]
+        for name, stats in rows:
+            values = "".join(f"{stats[f'p{q}']:>9.3f}" for q in STEP_PERCENTILES)
+            lines.append(f"{name[:70]:<70} {stats['count']:>6}{values} {stats['wait']:>9.3f} "
+                         f"{stats['retries']:>6} {stats['failed']:>5}")
+        return "\n".join(lines)
+
+    def save(self, folder: str = RUNNER_REPORT_DIR) -> str:
+        """Write summary and raw records as JSON and return the path."""
+        os.makedirs(folder, exist_ok=True)
+        file_name = time.strftime(f"steps{LOG_TIME_STRUCTURE}-{os.getpid()}.json", time.localtime())
+        file_path = os.path.join(folder, file_name)
+        with self._lock:
+            records = [asdict(record) for record in self.records]
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump({"summary": self.summary(), "records": records}, f, indent=2, default=str)
+        return file_path
+
+    def report(self) -> Optional[str]:
+        """Save the JSON report and log the summary table; nothing happens if no step was recorded."""
+        if not self.records:
+            return None
+        file_path = self.save()
+        self.logger.info("Step timings (seconds), report saved to %s:\n%s", file_path, self.table())
+        return file_path
+
+
+timings = StepTimings() if step_timing else None
+_step_hooks: List[Callable[[Any, StepRecord], None]] = []
+
+
+def current_step() -> Optional[StepRecord]:
+    return _current_step.get()
+
+
+def last_step() -> Optional[StepRecord]:
+    """The step that finished most recently in this context, for data collected right after it."""
+    return _last_step.get()
+
+
+def add_retries(count: int = 1) -> None:
+    """Count retries against the step that is running (no-op outside a timed step)."""
+    step = _current_step.get()
+    if step is not None and count:
+        step.retries += count
+
+
+def add_step_hook(hook: Callable[[Any, StepRecord], None]) -> None:
+    """Call `hook(instance, record)` whenever an outermost timed step starts, even without STEP_TIMING."""
+    if hook not in _step_hooks:
+        _step_hooks.append(hook)
+
+
+def _target_getter(func: Callable, target: Optional[str]) -> Callable:
+    if target is None:
+        return lambda args, kwargs: None
+    position = list(inspect.signature(func).parameters).index(target)
+
+    def get_target(args, kwargs):
+        value = kwargs.get(target, args[position] if len(args) > position else None)
+        if value is None:
+            return None
+        value = " ".join(str(value).split())
+        return value[:STEP_TARGET_LIMIT]
+    return get_target
+
+
+def _start(self, action, target):
+    scenario = get_log_context().get("scenario")
+    parent = _current_step.get()
+    record = StepRecord(type(self).__name__, action, target, time.time(), scenario=scenario,
+                        depth=parent.depth + 1 if parent is not None else 0)
+    if parent is None:
+        for hook in _step_hooks:
+            hook(self, record)
+    return record, _current_step.set(record), time.perf_counter()
+
+
+def _finish(record, token, start, wait, error=None):
+    record.wall = time.perf_counter() - start
+    if error is not None:
+        record.ok = False
+        record.error = repr(error)
+    if wait:
+        record.wait = record.wall
+    _current_step.reset(token)
+    _last_step.set(record)
+    parent = _current_step.get()
+    if parent is not None:
+        parent.wait += record.wait
+        parent.retries += record.retries
+    if timings is not None:
+        timings.add(record)
+
+
+def timed(action: Optional[str] = None, target: Optional[str] = None, wait: bool = False):
+    """
+    Record wall time, wait time and retries of a BasePage/API/Database method as a StepRecord.
+
+    Args:
+        action (str, optional): Step name, defaults to the method name.
+        target (str, optional): Name of the parameter identifying what is acted on (selector, url, query).
+        wait (bool): The whole call is waiting; its time is counted as `wait` of the enclosing step.
+
+    Records are kept only with STEP_TIMING=True; otherwise the call goes straight through unless a step hook
+    is registered. Works for sync and async methods.
+    """
+    def decorator(func):
+        name = action or func.__name__
+        get_target = _target_getter(func, target)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                if timings is None and not _step_hooks:
+                    return await func(self, *args, **kwargs)
+                record, token, start = _start(self, name, get_target((self,) + args, kwargs))
+                with log_context(step=name):
+                    try:
+                        result = await func(self, *args, **kwargs)
+                    except Exception as err:
+                        _finish(record, token, start, wait, err)
+                        raise
+                _finish(record, token, start, wait)
+                return result
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if timings is None and not _step_hooks:
+                return func(self, *args, **kwargs)
+            record, token, start = _start(self, name, get_target((self,) + args, kwargs))
+            with log_context(step=name):
+                try:
+                    result = func(self, *args, **kwargs)
+                except Exception as err:
+                    _finish(record, token, start, wait, err)
+                    raise
+            _finish(record, token, start, wait)
+            return result
+        return wrapper
+    return decorator
@@ -0,0 +1,75 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+import json
+import os
+import re
+import time
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from framework_inject.constants import DEFAULT_STORAGE_STATE_DIR, DEFAULT_STORAGE_STATE_TTL_SEC, \
+    DEFAULT_STORAGE_STATE_ENV
+from framework_inject.logger.logger import Logger
+
+load_dotenv()
+storage_state_dir = os.getenv("STORAGE_STATE_DIR") or DEFAULT_STORAGE_STATE_DIR
+storage_state_ttl = float(os.getenv("STORAGE_STATE_TTL_SEC", DEFAULT_STORAGE_STATE_TTL_SEC))
+storage_state_env = os.getenv("STORAGE_STATE_ENV") or DEFAULT_STORAGE_STATE_ENV
+
+
+class StorageStateStore(Logger):
+    """
+    Saved BrowserContext storage states (cookies + localStorage) keyed by user and environment.
+
+    A state is fresh while it is younger than `ttl` seconds and none of its expiring cookies has expired.
+    """
+
+    def __init__(self, folder: str = storage_state_dir, ttl: float = storage_state_ttl, logger=__file__):
+        super().__init__(logger)
+        self.folder = os.path.expanduser(folder)
+        self.ttl = ttl
+
+    def path(self, user: str, env: Optional[str] = None) -> str:
+        name = re.sub(r"[^\w.-]", "_", f"{env or storage_state_env}-{user}")
+        return os.path.join(self.folder, f"{name}.json")
+
+    def is_fresh(self, user: str, env: Optional[str] = None) -> bool:
+        path = self.path(user, env)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return False
+            with open(path, "r", encoding="utf-8") as f:
+                cookies = json.load(f).get("cookies", [])
+        except (OSError, ValueError):
+            return False
+        now = time.time()
+        return all(cookie.get("expires", -1) <= 0 or cookie["expires"] > now for cookie in cookies)
+
+    def load(self, user: str, env: Optional[str] = None) -> Optional[str]:
+        """
+        Path of a fresh storage state for `new_context(storage_state=...)`, None if missing or expired.
+        """
+        if self.is_fresh(user, env):
+            return self.path(user, env)
+        self.logger.debug(f"No fresh storage state for '{user}'")
+        return None
+
+    def save(self, context, user: str, env: Optional[str] = None) -> str:
+        """
+        Save the storage state of a (sync) BrowserContext and return its path.
+        """
+        os.makedirs(self.folder, exist_ok=True)
+        path = self.path(user, env)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        context.storage_state(path=tmp_path)
+        os.replace(tmp_path, path)
+        self.logger.info(f"Storage state for '{user}' saved to {path}")
+        return path
+
+    def invalidate(self, user: str, env: Optional[str] = None) -> None:
+        """Forget a state, e.g. when a flow finds itself logged out."""
+        try:
+            os.remove(self.path(user, env))
+        except OSError:
+            pass
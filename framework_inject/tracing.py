@@ -0,0 +1,223 @@
+"""Framework: https://github.com/eshut/Inject-Framework"""
+
+import itertools
+import os
+import re
+import shutil
+import tempfile
+import time
+from collections import deque
+from typing import List, Optional
+
+from dotenv import load_dotenv
+
+from framework_inject.constants import TRACE_OFF, TRACE_ON, TRACE_RETAIN_ON_FAILURE, TRACE_MODES, TRACE_DIR, \
+    DEFAULT_TRACE_RING_SIZE, LOG_TIME_STRUCTURE
+from framework_inject.logger.logger import Logger
+from framework_inject.step_timing import add_step_hook
+
+load_dotenv()
+trace_mode = os.getenv("TRACE_MODE", TRACE_OFF).lower()
+trace_ring_size = int(os.getenv("TRACE_RING_SIZE", DEFAULT_TRACE_RING_SIZE))
+record_har = os.getenv("RECORD_HAR", "False").lower() == "true"
+har_content = os.getenv("HAR_CONTENT", "omit")
+
+if trace_mode not in TRACE_MODES:
+    raise ValueError(f"Unknown TRACE_MODE '{trace_mode}', expected one of {TRACE_MODES}")
+
+_recorders = {}
+_counter = itertools.count(1)
+
+
+def _safe_name(text: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", text).strip("_")[:80]
+
+
+class ContextRecorder(Logger):
+    """
+    Playwright tracing and HAR recording of one BrowserContext (TRACE_MODE, RECORD_HAR in `.env`).
+
+    - "on": the whole context is traced and saved to logs/traces when the context is closed.
+    - "retain-on-failure": every outermost page step (see step_timing) is a separate trace chunk and only the
+      last `ring_size` chunks are kept on disk. `retain` moves them to logs/traces after a failure,
+      `discard` drops them after a success, so passing runs leave nothing behind.
+
+    The HAR is written by Playwright when the context closes; in retain-on-failure mode it is kept only
+    if a failure was retained for this context. A context the framework did not create (the default context of
+    a remote browser, `owns_context=False`) can only be traced; closing the recorder leaves it open.
+    """
+
+    def __init__(self, mode: str = trace_mode, har: bool = record_har, ring_size: int = trace_ring_size,
+                 owns_context: bool = True, logger=__file__):
+        super().__init__(logger)
+        self.mode = mode
+        self.ring_size = ring_size
+        self.owns_context = owns_context
+        self.used = False
+        self.id = f"{os.getpid()}-{next(_counter)}"
+        os.makedirs(TRACE_DIR, exist_ok=True)
+        self.work_dir = tempfile.mkdtemp(prefix=f".work-{self.id}-", dir=TRACE_DIR)
+        self.har_path = os.path.join(self.work_dir, "network.har") if har else None
+        self.context = None
+        self.chunks = deque()
+        self.chunk_name = None
+        self.failure_dir = None
+        self._chunk_number = 0
+
+    def context_options(self) -> dict:
+        """Extra `browser.new_context` options (HAR recording)."""
+        if not self.har_path:
+            return {}
+        return {"record_har_path": self.har_path, "record_har_content": har_content}
+
+    def attach(self, context) -> None:
+        self.context = context
+        _recorders[context] = self
+        if self.mode == TRACE_OFF:
+            return
+        context.tracing.start(screenshots=True, snapshots=True, title=self.id)
+        if self.mode == TRACE_RETAIN_ON_FAILURE:
+            self._start_chunk("start")
+
+    def _start_chunk(self, title: str) -> None:
+        self._chunk_number += 1
+        self.chunk_name = f"{self._chunk_number:04d}-{_safe_name(title)}"
+        self.context.tracing.start_chunk(title=title)
+
+    def _stop_chunk(self) -> None:
+        path = os.path.join(self.work_dir, f"{self.chunk_name}.zip")
+        self.context.tracing.stop_chunk(path=path)
+        self.chunks.append(path)
+        while len(self.chunks) > self.ring_size:
+            os.remove(self.chunks.popleft())
+
+    def step(self, title: str) -> None:
+        """Close the running chunk into the ring buffer and start a new one for the next step."""
+        if self.mode != TRACE_RETAIN_ON_FAILURE:
+            return
+        try:
+            self._stop_chunk()
+            self._start_chunk(title)
+        except Exception as e:
+            self.logger.debug("Could not rotate trace chunk: %s", e)
+
+    def retain(self, name: str) -> Optional[str]:
+        """
+        Keep the buffered steps (and later the HAR) of a failed scenario in logs/traces/<name>-...;
+        returns the folder. Only retain-on-failure buffers anything; other modes save at close.
+        """
+        self.used = False
+        if self.mode != TRACE_RETAIN_ON_FAILURE:
+            return None
+        self.failure_dir = os.path.join(TRACE_DIR, f"{_safe_name(name)}{time.strftime(LOG_TIME_STRUCTURE)}-{self.id}")
+        os.makedirs(self.failure_dir, exist_ok=True)
+        self.step("after-failure")
+        while self.chunks:
+            path = self.chunks.popleft()
+            shutil.move(path, os.path.join(self.failure_dir, os.path.basename(path)))
+        self.logger.info("Trace of failed scenario %s kept in %s", name, self.failure_dir)
+        return self.failure_dir
+
+    def discard(self) -> None:
+        """Drop the buffered steps (the scenario passed)."""
+        self.used = False
+        if self.mode != TRACE_RETAIN_ON_FAILURE:
+            return
+        while self.chunks:
+            os.remove(self.chunks.popleft())
+        try:
+            self.context.tracing.stop_chunk()
+            self._start_chunk("start")
+        except Exception as e:
+            self.logger.debug("Could not restart trace chunk: %s", e)
+
+    def close(self) -> None:
+        """
+        Stop tracing, close the context (which writes the HAR) and keep or delete the recordings.
+        With `owns_context=False` only the recording stops.
+        """
+        _recorders.pop(self.context, None)
+        stamp = f"{time.strftime(LOG_TIME_STRUCTURE)}-{self.id}"
+        try:
+            if self.mode == TRACE_ON:
+                trace_path = os.path.join(TRACE_DIR, f"trace{stamp}.zip")
+                self.context.tracing.stop(path=trace_path)
+                self.logger.info("Trace saved to %s", trace_path)
+            elif self.mode == TRACE_RETAIN_ON_FAILURE:
+                self.context.tracing.stop()
+        except Exception as e:
+            self.logger.debug("Could not stop tracing: %s", e)
+        try:
+            if self.owns_context:
+                self.context.close()
+        finally:
+            if self.har_path and os.path.exists(self.har_path):
+                if self.mode != TRACE_RETAIN_ON_FAILURE:
+                    shutil.move(self.har_path, os.path.join(TRACE_DIR, f"har{stamp}.har"))
+                elif self.failure_dir:
+                    shutil.move(self.har_path, os.path.join(self.failure_dir, "network.har"))
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+
+
+def new_recorder(har: bool = record_har, owns_context: bool = True) -> Optional[ContextRecorder]:
+    """ContextRecorder for a context about to be created, or None when tracing and HAR are off."""
+    if trace_mode == TRACE_OFF and not har:
+        return None
+    return ContextRecorder(har=har, owns_context=owns_context)
+
+
+def close_context(context) -> None:
+    """
+    Close a BrowserContext, saving its trace/HAR first if it is recorded.
+    Contexts the framework does not own are only detached from their recorder.
+    """
+    recorder = _recorders.get(context)
+    if recorder is not None:
+        recorder.close()
+    else:
+        context.close()
+
+
+def is_recorded(context) -> bool:
+    return context in _recorders
+
+
+def _scenario_recorders(contexts=None) -> List[ContextRecorder]:
+    if contexts is not None:
+        return [_recorders[context] for context in contexts if context in _recorders]
+    return [recorder for recorder in _recorders.values() if recorder.used]
+
+
+def retain_failure(name: str, contexts=None) -> List[str]:
+    """
+    Keep the recent steps after scenario `name` failed. Applies to `contexts`, or by default to the recorded
+    contexts that ran a page step since the last retain/discard (idle pool slots are left alone).
+    """
+    folders = [recorder.retain(name) for recorder in _scenario_recorders(contexts)]
+    return [folder for folder in folders if folder]
+
+
+def discard_steps(contexts=None) -> None:
+    """Forget the recent steps after a passed scenario; same scoping as `retain_failure`."""
+    for recorder in _scenario_recorders(contexts):
+        recorder.discard()
+
+
+def _on_step(instance, record) -> None:
+    if not _recorders:
+        return
+    try:
+        page = getattr(instance, "page", None)
+        recorder = _recorders.get(page.context) if page is not None else None
+    except Exception:
+        return
+    if recorder is not None:
+        recorder.used = True
+        title = f"{record.component}.{record.action}"
+        if record.target:
+            title += f" {record.target}"
+        recorder.step(title)
+
+
+if trace_mode == TRACE_RETAIN_ON_FAILURE:
+    add_step_hook(_on_step)
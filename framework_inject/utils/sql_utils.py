@@ -1,25 +1,28 @@
 import mysql.connector
-from logger.logger import Logger
+from framework_inject.logger.logger import Logger
+from framework_inject.services.sql_service import get_connection_pool, db_pool_size, iter_query
 
 
 class SQLUtil(Logger):
-    def __init__(self, host, user, password, database, port, dictionary=False, logger=__file__):
+    def __init__(self, host, user, password, database, port, dictionary=False, logger=__file__, *,
+                 pool_size=db_pool_size):
         super().__init__(logger)
-        self.db = mysql.connector.connect(
-            host=host,
-            user=user,
-            password=password,
-            database=database,
-            port=int(port),
-            collation="utf8mb4_general_ci"
-        )
+        self.pool = get_connection_pool(host, user, password, database, port, pool_size)
         self.dictionary = dictionary
+        self._db = None
+
+    @property
+    def db(self):
+        """Connection held for direct cursor()/commit() use; queries check one out of the pool each time."""
+        if self._db is None:
+            self._db = self.pool.get_connection()
+        return self._db
 
     def ensure_connection(self):
-        """Ensure the database connection is alive, reconnect if needed."""
-        if not self.db.is_connected():
+        """Ensure the held database connection is alive, reconnect if needed."""
+        if self._db is not None and not self._db.is_connected():
             self.logger.warning("Database connection lost. Reconnecting...")
-            self.db.reconnect()
+            self._db.reconnect()
 
     def cursor(self, dictionary=None):
         """Get a database cursor."""
@@ -30,35 +33,49 @@ class SQLUtil(Logger):
 
     def run_script(self, script, args=None, dictionary=None):
         """Run a SQL script and fetch results."""
+        if dictionary is None:
+            dictionary = self.dictionary
         try:
-            cursor = self.cursor(dictionary=dictionary)
-            cursor.execute(script, args)
-            result = cursor.fetchall()
-            cursor.close()
-            return result
+            with self.pool.connection() as db:
+                cursor = db.cursor(dictionary=dictionary)
+                cursor.execute(script, args)
+                result = cursor.fetchall()
+                cursor.close()
+                return result
         except mysql.connector.Error as err:
             self.logger.error(f"Error executing script: {err}")
             return None
 
+    def iter_script(self, script, args=None, dictionary=None, chunk_size=None):
+        """Stream the result of a SQL script row by row (or in `chunk_size` lists) instead of fetchall()."""
+        if dictionary is None:
+            dictionary = self.dictionary
+        return iter_query(self.pool, script, args, dictionary, chunk_size)
+
     def update_data(self, query, args=None):
         """Update data in the database."""
         try:
-            cursor = self.cursor()
-            cursor.execute(query, args)
-            cursor_id = cursor.lastrowid
-            self.db.commit()
-            cursor.close()
-            self.logger.debug(f"Query executed successfully: {query}")
-            return cursor_id
+            with self.pool.connection() as db:
+                try:
+                    cursor = db.cursor()
+                    cursor.execute(query, args)
+                    cursor_id = cursor.lastrowid
+                    db.commit()
+                    cursor.close()
+                    self.logger.debug(f"Query executed successfully: {query}")
+                    return cursor_id
+                except mysql.connector.Error:
+                    db.rollback()
+                    raise
         except mysql.connector.Error as err:
             self.logger.error(f"Error executing update query: {err}")
-            self.db.rollback()
             return None
 
     def close_connect(self):
-        """Close the database connection."""
-        if self.db.is_connected():
-            self.db.close()
+        """Return the held database connection to the pool."""
+        if self._db is not None:
+            self.pool.put_connection(self._db)
+            self._db = None
 
     def commit(self):
         """Commit the current transaction."""
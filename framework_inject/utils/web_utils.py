@@ -1,7 +1,7 @@
 import os
-import requests
 
-from logger.logger import Logger
+from framework_inject.logger.logger import Logger
+from framework_inject.services.http_session import get_session, stream_to_file
 
 
 class WebUtils(Logger):
@@ -20,12 +20,11 @@ class WebUtils(Logger):
         if not os.path.exists(save_dir):
             os.makedirs(save_dir)
         try:
-            response = requests.get(image_url)
-            response.raise_for_status()
-            # image_name = os.path.basename(image_url)
-            image_path = os.path.join(save_dir, image_name)
-            with open(image_path, 'wb') as file:
-                file.write(response.content)
+            with get_session().get(image_url, stream=True) as response:
+                response.raise_for_status()
+                # image_name = os.path.basename(image_url)
+                image_path = os.path.join(save_dir, image_name)
+                stream_to_file(response, image_path)
 
             return image_name
         except Exception as e: